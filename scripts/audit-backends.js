@@ -3,7 +3,7 @@
  * Audit every configured backend and report which ones actually work.
  *
  * Standalone CLI — not imported by the server at runtime.
- * Run: node scripts/audit-backends.js [--json] [--timeout <ms>]
+ * Run: node scripts/audit-backends.js [--json] [--timeout <ms> | --timeout=<ms>]
  */
 
 import { readFileSync } from 'node:fs';
@@ -17,15 +17,30 @@ const BACKENDS_CONFIG = JSON.parse(
   readFileSync(fileURLToPath(new URL('../src/config/backends.json', import.meta.url)), 'utf-8')
 );
 
-function parseArgs() {
-  const args = process.argv.slice(2);
-  let json = false;
-  let timeout = 20000;
-  for (let i = 0; i < args.length; i++) {
-    if (args[i] === '--json') json = true;
-    else if (args[i] === '--timeout') timeout = Number(args[++i]) || 20000;
+const DEFAULT_TIMEOUT_MS = 20000;
+
+// Flag name -> handler. `takesValue` flags accept both `--flag value` and
+// `--flag=value`; adding a flag is one entry here, not another branch.
+const FLAGS = new Map([
+  ['--json', { takesValue: false, apply: (opts) => { opts.json = true; } }],
+  ['--timeout', { takesValue: true, apply: (opts, value) => { opts.timeout = Number(value) || DEFAULT_TIMEOUT_MS; } }],
+]);
+
+function parseArgs(argv = process.argv.slice(2)) {
+  const opts = { json: false, timeout: DEFAULT_TIMEOUT_MS };
+  for (let i = 0; i < argv.length; i++) {
+    const eq = argv[i].indexOf('=');
+    const name = eq === -1 ? argv[i] : argv[i].slice(0, eq);
+    const flag = FLAGS.get(name);
+    // A switch given =value (e.g. --json=false) is malformed, not a silent enable
+    if (!flag || (!flag.takesValue && eq !== -1)) {
+      console.error(`audit-backends: ignoring unknown option ${argv[i]}`);
+      continue;
+    }
+    const value = !flag.takesValue ? undefined : eq !== -1 ? argv[i].slice(eq + 1) : argv[++i];
+    flag.apply(opts, value);
   }
-  return { json, timeout };
+  return opts;
 }
 
 function endpointFor(config, type) {
@@ -129,54 +144,55 @@ async function probeOpenaiCompatible(url, config, key, timeout) {
 
 // ── main ────────────────────────────────────────────────────────────────────
 
-async function main() {
-  const { json, timeout } = parseArgs();
-  const backends = BACKENDS_CONFIG.backends;
-  const results = [];
-
-  for (const [name, def] of Object.entries(backends)) {
-    if (!def.enabled) continue;
+async function auditBackend(name, def, timeout) {
+  const type = def.type;
+  const config = def.config ?? {};
+  const model = config.model ?? null;
+  const tableEntry = TYPE_TABLE[type] ?? {};
+  const envVar = tableEntry.envVar ?? '';
 
-    const type = def.type;
-    const config = def.config ?? {};
-    const model = config.model ?? null;
-    const tableEntry = TYPE_TABLE[type] ?? {};
-    const envVar = tableEntry.envVar ?? '';
-
-    // Class: no model
-    if (!model && type !== 'local') {
-      results.push({ backend: name, model: '(none)', status: 'NO_MODEL', detail: '' });
-      continue;
-    }
+  // Class: no model
+  if (!model && type !== 'local') {
+    return { backend: name, model: '(none)', status: 'NO_MODEL', detail: '' };
+  }
 
-    // Local — reachability only
-    if (type === 'local') {
-      const r = await probeLocal(config, timeout);
-      results.push({ backend: name, model: model ?? '(none)', status: r.status, detail: r.detail ?? '' });
-      continue;
-    }
+  // Local — reachability only
+  if (type === 'local') {
+    const r = await probeLocal(config, timeout);
+    return { backend: name, model: model ?? '(none)', status: r.status, detail: r.detail ?? '' };
+  }
 
-    // Key resolution
-    const key = resolveBackendKey(config, envVar);
-    if (!key) {
-      results.push({ backend: name, model, status: 'NO_KEY', detail: `cannot verify — ${envVar} not set` });
-      continue;
-    }
+  // Key resolution
+  const key = resolveBackendKey(config, envVar);
+  if (!key) {
+    return { backend: name, model, status: 'NO_KEY', detail: `cannot verify — ${envVar} not set` };
+  }
 
-    // Probe
-    let r;
-    if (type === 'gemini') {
-      r = await probeGemini(config, key, timeout);
+  // Probe
+  let r;
+  if (type === 'gemini') {
+    r = await probeGemini(config, key, timeout);
+  } else {
+    const url = endpointFor(config, type);
+    if (!url) {
+      r = { status: 'ERROR', detail: 'no endpoint' };
     } else {
-      const url = endpointFor(config, type);
-      if (!url) {
-        r = { status: 'ERROR', detail: 'no endpoint' };
-      } else {
-        r = await probeOpenaiCompatible(url, config, key, timeout);
-      }
+      r = await probeOpenaiCompatible(url, config, key, timeout);
     }
-    results.push({ backend: name, model, status: r.status, detail: r.detail ?? '' });
   }
+  return { backend: name, model, status: r.status, detail: r.detail ?? '' };
+}
+
+async function main() {
+  const { json, timeout } = parseArgs();
+  const backends = BACKENDS_CONFIG.backends;
+
+  // auditBackend never throws, so one slow or failing probe can't sink the rest
+  const results = await Promise.all(
+    Object.entries(backends)
+      .filter(([, def]) => def.enabled)
+      .map(([name, def]) => auditBackend(name, def, timeout))
+  );
 
   // ── output ──────────────────────────────────────────────────────────────
 
@@ -7,6 +7,7 @@
  */
 
 import { isModelRetired, buildRetiredModelError } from './model-retirement.js';
+import { responseCache } from '../utils/response-cache.js';
 
 /**
  * Drop keys whose value is undefined.
@@ -22,6 +23,67 @@ export function stripUndefined(obj = {}) {
   return Object.fromEntries(Object.entries(obj).filter(([, v]) => v !== undefined));
 }
 
+/**
+ * Transient-failure retry policy for makeAPICall. Rate limits and gateway/server
+ * blips usually clear within a second or two, so a short bounded backoff resolves
+ * them before the failure reaches the circuit breaker or a fallback backend.
+ * Timeouts and client errors (4xx other than 429) are never retried.
+ */
+const HTTP_RETRY_CONFIG = {
+  maxRetries: 2,
+  baseDelayMs: 300,
+  maxDelayMs: 8000,
+  retryableStatuses: new Set([429, 500, 502, 503, 504])
+};
+
+/**
+ * Milliseconds to wait before retrying a transient failure, or null to give up.
+ * Honors a Retry-After header (delta-seconds or HTTP-date); otherwise backs off
+ * exponentially. A server asking for longer than maxDelayMs gets no retry — waiting
+ * that long would only delay the fallback chain.
+ * @param {Response} response - The failed response
+ * @param {number} attempt - Zero-based retry attempt
+ * @param {Object} [policy=HTTP_RETRY_CONFIG]
+ * @returns {number|null}
+ */
+function getRetryDelay(response, attempt, policy = HTTP_RETRY_CONFIG) {
+  const retryAfter = response.headers?.get?.('retry-after');
+  if (retryAfter) {
+    const seconds = Number(retryAfter);
+    const delay = Number.isFinite(seconds)
+      ? seconds * 1000
+      : Date.parse(retryAfter) - Date.now();
+    if (Number.isFinite(delay)) {
+      return delay > policy.maxDelayMs ? null : Math.max(0, delay);
+    }
+  }
+  return Math.min(policy.baseDelayMs * 2 ** attempt, policy.maxDelayMs);
+}
+
+/**
+ * Flag a replayed response and zero its usage block: a cache hit costs no tokens,
+ * so token analytics and thread totals must not bill the original request twice.
+ * @param {Object} data - Copy of the cached provider payload
+ * @returns {Object}
+ */
+function markCachedResponse(data) {
+  data.cached = true;
+  if (data.usage) {
+    data.usage = { prompt_tokens: 0, completion_tokens: 0, total_tokens: 0 };
+  }
+  return data;
+}
+
+/**
+ * Circuit breaker states. A single state field replaces the old open flag so every
+ * transition can be made with a compare-and-set: once the reset timeout expires,
+ * exactly one caller moves OPEN -> HALF_OPEN and probes the backend while concurrent
+ * callers keep failing fast until the probe settles.
+ */
+const CIRCUIT_CLOSED = 0;
+const CIRCUIT_OPEN = 1;
+const CIRCUIT_HALF_OPEN = 2;
+
 /**
  * @typedef {Object} BackendConfig
  * @property {string} name - Backend identifier
@@ -32,6 +94,7 @@ export function stripUndefined(obj = {}) {
  * @property {number} [timeout] - Request timeout in ms
  * @property {boolean} [streaming] - Whether streaming is supported
  * @property {Object} [headers] - Additional headers
+ * @property {number} [maxRetries] - Retries for transient HTTP failures (429/5xx)
  */
 
 /**
@@ -80,6 +143,7 @@ class BackendAdapter {
       timeout: 30000,
       maxTokens: 4096,
       streaming: false,
+      maxRetries: HTTP_RETRY_CONFIG.maxRetries,
       ...config
     };
 
@@ -91,12 +155,13 @@ class BackendAdapter {
       totalRequests: 0,
       successfulRequests: 0,
       failedRequests: 0,
+      cachedResponses: 0,
       totalLatency: 0,
       averageLatency: 0
     };
 
-    /** @type {boolean} */
-    this.circuitOpen = false;
+    /** @type {number} One of CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN */
+    this.circuitState = CIRCUIT_CLOSED;
 
     /** @type {number} */
     this.consecutiveFailures = 0;
@@ -117,6 +182,9 @@ class BackendAdapter {
     // cost control.
     /** @type {boolean} */
     this.omitDefaultMaxTokens = false;
+
+    /** @type {{apiKey: string|undefined, extraHeaders: Object|undefined, headers: Object}|null} */
+    this._headersCache = null;
   }
 
   /**
@@ -159,12 +227,41 @@ class BackendAdapter {
   }
 
   async makeAPICall(body, errorPrefix = 'API error') {
-    const response = await fetch(this.config.url, {
-      method: 'POST',
-      headers: this.buildHeaders(),
-      body: JSON.stringify(body),
-      signal: AbortSignal.timeout(this.config.timeout)
-    });
+    const serializedBody = JSON.stringify(body);
+
+    // Low-temperature, non-streaming calls are effectively deterministic — replay
+    // an identical earlier answer instead of paying for the round-trip again.
+    const cacheKey = responseCache.isCacheable(body)
+      ? responseCache.keyFor(this.config.url, serializedBody)
+      : null;
+    // A half-open probe must reach the backend; a replay proves nothing about it
+    if (cacheKey && this.circuitState === CIRCUIT_CLOSED) {
+      const cached = responseCache.get(cacheKey);
+      if (cached) return markCachedResponse(cached);
+    }
+
+    let response;
+    for (let attempt = 0; ; attempt++) {
+      response = await fetch(this.config.url, {
+        method: 'POST',
+        headers: this.buildHeaders(),
+        body: serializedBody,
+        signal: AbortSignal.timeout(this.config.timeout)
+      });
+
+      if (response.ok || attempt >= this.config.maxRetries ||
+          !HTTP_RETRY_CONFIG.retryableStatuses.has(response.status)) {
+        break;
+      }
+      const delay = getRetryDelay(response, attempt);
+      if (delay === null) {
+        break;
+      }
+      // Release the connection before waiting on it
+      await response.body?.cancel?.().catch(() => {});
+      console.error(`[${this.name}] HTTP ${response.status}, retrying in ${delay}ms (${attempt + 1}/${this.config.maxRetries})`);
+      await new Promise(resolve => setTimeout(resolve, delay));
+    }
 
     if (!response.ok) {
       const error = await response.text();
@@ -185,7 +282,9 @@ class BackendAdapter {
       throw new Error(`${errorPrefix}: ${response.status} - ${safeError}`);
     }
 
-    return response.json();
+    const data = await response.json();
+    if (cacheKey) responseCache.set(cacheKey, data);
+    return data;
   }
 
   /**
@@ -204,7 +303,7 @@ class BackendAdapter {
    * @returns {Promise<BackendHealth>}
    */
   async checkHealth() {
-    const startTime = Date.now();
+    const startTime = performance.now();
     try {
       const body = this.getHealthCheckBody();
       const response = await fetch(this.config.url, {
@@ -216,7 +315,7 @@ class BackendAdapter {
 
       this.lastHealth = {
         healthy: response.ok,
-        latency: Date.now() - startTime,
+        latency: Math.round(performance.now() - startTime),
         checkedAt: new Date(),
         error: response.ok ? null : `Status ${response.status}`
       };
@@ -224,7 +323,7 @@ class BackendAdapter {
     } catch (error) {
       this.lastHealth = {
         healthy: false,
-        latency: Date.now() - startTime,
+        latency: Math.round(performance.now() - startTime),
         checkedAt: new Date(),
         error: error.message
       };
@@ -241,29 +340,73 @@ class BackendAdapter {
     return safeConfig;
   }
 
+  /**
+   * Whether the circuit breaker is rejecting requests (open or probing)
+   * @type {boolean}
+   */
+  get circuitOpen() {
+    return this.circuitState !== CIRCUIT_CLOSED;
+  }
+
+  set circuitOpen(open) {
+    this.circuitState = open ? CIRCUIT_OPEN : CIRCUIT_CLOSED;
+  }
+
+  /**
+   * Move the circuit from one state to another only if it is still in `expected`.
+   * Every await point can interleave another request, so transitions that depend on
+   * the state read before the await go through here instead of plain assignment.
+   * @param {number} expected - State the caller observed
+   * @param {number} next - State to move to
+   * @returns {boolean} Whether this caller made the transition
+   * @private
+   */
+  _compareAndSetCircuit(expected, next) {
+    if (this.circuitState !== expected) return false;
+    this.circuitState = next;
+    if (next === CIRCUIT_OPEN) {
+      this.circuitOpenedAt = Date.now();
+    } else if (next === CIRCUIT_CLOSED) {
+      this.consecutiveFailures = 0;
+    }
+    return true;
+  }
+
+  /**
+   * Claim the half-open probe once the reset timeout has expired
+   * @returns {boolean} Whether this caller owns the probe
+   * @private
+   */
+  _beginProbe() {
+    return Date.now() - this.circuitOpenedAt > this.circuitResetTimeout &&
+      this._compareAndSetCircuit(CIRCUIT_OPEN, CIRCUIT_HALF_OPEN);
+  }
+
   /**
    * Check if backend is available (healthy and circuit closed)
    * @returns {Promise<boolean>}
    */
   async isAvailable() {
-    // Check circuit breaker
-    if (this.circuitOpen) {
-      // Check if we should try to reset
-      if (Date.now() - this.circuitOpenedAt > this.circuitResetTimeout) {
-        this.circuitOpen = false;
-        this.consecutiveFailures = 0;
-        console.error(`[${this.name}] Circuit breaker reset, attempting recovery`);
-      } else {
-        return false;
-      }
+    // Check circuit breaker; the health check doubles as the half-open probe
+    let probe = false;
+    if (this.circuitState !== CIRCUIT_CLOSED) {
+      probe = this._beginProbe();
+      if (!probe) return false;
+      console.error(`[${this.name}] Circuit breaker half-open, attempting recovery`);
     }
 
+    let healthy = false;
     try {
       const health = await this.checkHealth();
-      return health.healthy;
+      healthy = health.healthy;
     } catch (error) {
-      return false;
+      healthy = false;
+    }
+
+    if (probe) {
+      this._compareAndSetCircuit(CIRCUIT_HALF_OPEN, healthy ? CIRCUIT_CLOSED : CIRCUIT_OPEN);
     }
+    return healthy;
   }
 
   /**
@@ -273,29 +416,37 @@ class BackendAdapter {
    * @returns {Promise<BackendResponse>}
    */
   async execute(prompt, options = {}) {
-    // Check circuit breaker
-    if (this.circuitOpen) {
-      if (Date.now() - this.circuitOpenedAt > this.circuitResetTimeout) {
-        this.circuitOpen = false;
-        this.consecutiveFailures = 0;
-        console.error(`[${this.name}] Circuit breaker reset, attempting request`);
-      } else {
+    // Check circuit breaker: only one caller gets to probe a recovering backend
+    let probe = false;
+    if (this.circuitState !== CIRCUIT_CLOSED) {
+      probe = this._beginProbe();
+      if (!probe) {
         throw new Error(`Circuit breaker open for ${this.name}`);
       }
+      console.error(`[${this.name}] Circuit breaker half-open, attempting request`);
     }
 
-    const startTime = Date.now();
+    // Monotonic clock: latency must not jump with wall-clock adjustments
+    const startTime = performance.now();
     this.metrics.totalRequests++;
 
     try {
       const response = await this.makeRequest(prompt, options);
-      const latency = Date.now() - startTime;
+      const latency = Math.round(performance.now() - startTime);
 
-      // Update metrics on success
-      this.metrics.successfulRequests++;
-      this.metrics.totalLatency += latency;
-      this.metrics.averageLatency = this.metrics.totalLatency / this.metrics.successfulRequests;
-      this.consecutiveFailures = 0;
+      if (response.metadata?.cached) {
+        // Served from the response cache: says nothing about backend latency or health
+        this.metrics.cachedResponses++;
+      } else {
+        // Update metrics on success
+        this.metrics.successfulRequests++;
+        this.metrics.totalLatency += latency;
+        this.metrics.averageLatency = this.metrics.totalLatency / this.metrics.successfulRequests;
+        this.consecutiveFailures = 0;
+        if (probe && this._compareAndSetCircuit(CIRCUIT_HALF_OPEN, CIRCUIT_CLOSED)) {
+          console.error(`[${this.name}] Circuit breaker closed, backend recovered`);
+        }
+      }
 
       return {
         ...response,
@@ -311,13 +462,16 @@ class BackendAdapter {
       // open the circuit immediately instead of waiting for circuitOpenThreshold
       // consecutive failures, so later calls (and makeRequestWithFallback's chain)
       // fail fast rather than repeatedly retrying a model the provider no longer serves.
+      // A failed probe re-opens the circuit for another reset period.
       if (error.isModelRetired) {
-        this.circuitOpen = true;
-        this.circuitOpenedAt = Date.now();
+        this._compareAndSetCircuit(this.circuitState, CIRCUIT_OPEN);
         console.error(`[${this.name}] Circuit breaker opened: model retired (${error.message.slice(0, 100)})`);
-      } else if (this.consecutiveFailures >= this.circuitOpenThreshold) {
-        this.circuitOpen = true;
-        this.circuitOpenedAt = Date.now();
+      } else if (probe) {
+        if (this._compareAndSetCircuit(CIRCUIT_HALF_OPEN, CIRCUIT_OPEN)) {
+          console.error(`[${this.name}] Circuit breaker re-opened: recovery probe failed`);
+        }
+      } else if (this.consecutiveFailures >= this.circuitOpenThreshold &&
+        this._compareAndSetCircuit(CIRCUIT_CLOSED, CIRCUIT_OPEN)) {
         console.error(`[${this.name}] Circuit breaker opened after ${this.consecutiveFailures} failures`);
       }
 
@@ -346,6 +500,7 @@ class BackendAdapter {
       totalRequests: 0,
       successfulRequests: 0,
       failedRequests: 0,
+      cachedResponses: 0,
       totalLatency: 0,
       averageLatency: 0
     };
@@ -355,7 +510,7 @@ class BackendAdapter {
    * Force close circuit breaker (for testing/recovery)
    */
   closeCircuit() {
-    this.circuitOpen = false;
+    this.circuitState = CIRCUIT_CLOSED;
     this.consecutiveFailures = 0;
     this.circuitOpenedAt = null;
   }
@@ -364,26 +519,39 @@ class BackendAdapter {
    * Force open circuit breaker (for maintenance)
    */
   openCircuit() {
-    this.circuitOpen = true;
+    this.circuitState = CIRCUIT_OPEN;
     this.circuitOpenedAt = Date.now();
   }
 
   /**
    * Build request headers
+   *
+   * Built once per adapter and reused: every request to a backend carries the same
+   * auth/content-type headers, and Node's fetch already pools keep-alive connections
+   * per origin, so rebuilding (and re-templating the Bearer token) on every call is
+   * pure overhead. The cache is keyed on the apiKey/headers it was built from, so a
+   * config change still takes effect on the next call.
    * @protected
-   * @returns {Object}
+   * @returns {Object} Frozen header map — copy it before mutating
    */
   buildHeaders() {
+    const { apiKey, headers: extraHeaders } = this.config;
+    const cached = this._headersCache;
+    if (cached && cached.apiKey === apiKey && cached.extraHeaders === extraHeaders) {
+      return cached.headers;
+    }
+
     const headers = {
       'Content-Type': 'application/json',
-      ...this.config.headers
+      ...extraHeaders
     };
 
-    if (this.config.apiKey) {
-      headers['Authorization'] = `Bearer ${this.config.apiKey}`;
+    if (apiKey) {
+      headers['Authorization'] = `Bearer ${apiKey}`;
     }
 
-    return headers;
+    this._headersCache = { apiKey, extraHeaders, headers: Object.freeze(headers) };
+    return this._headersCache.headers;
   }
 
   /**
@@ -396,7 +564,7 @@ class BackendAdapter {
   buildRequestBody(prompt, options) {
     const body = {
       messages: [{ role: 'user', content: prompt }],
-      temperature: options.temperature || 0.7,
+      temperature: options.temperature ?? 0.7,
       stream: options.stream || this.config.streaming
     };
 
@@ -445,10 +613,11 @@ class BackendAdapter {
       success: true,
       metadata: {
         model: response.model,
-        finishReason: response.choices?.[0]?.finish_reason
+        finishReason: response.choices?.[0]?.finish_reason,
+        cached: response.cached === true
       }
     };
   }
 }
 
-export { BackendAdapter };
+export { BackendAdapter, HTTP_RETRY_CONFIG, getRetryDelay, CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN };
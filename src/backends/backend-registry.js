@@ -627,35 +627,43 @@ class BackendRegistry {
    * @returns {Object}
    */
   getStats() {
-    const total = this.backends.size;
-    const enabled = this.getEnabledBackends().length;
-    const adapterList = Array.from(this.adapters.values());
-    const healthy = adapterList.filter(a => a.lastHealth?.healthy === true).length;
+    // One pass per map: tally health over adapters, then build the backend list
+    // and count enabled entries together
+    let healthy = 0;
     // A backend that has never been probed is UNKNOWN, not unhealthy. Counting the
     // two together made a freshly-started server report "0 healthy" before the first
     // health sweep, which reads as a total outage.
-    const unknown = adapterList.filter(a => a.lastHealth == null).length;
+    let unknown = 0;
+    for (const adapter of this.adapters.values()) {
+      if (adapter.lastHealth == null) unknown++;
+      else if (adapter.lastHealth.healthy === true) healthy++;
+    }
+
+    let enabled = 0;
+    const backends = new Array(this.backends.size);
+    let i = 0;
+    for (const b of this.backends.values()) {
+      if (b.enabled) enabled++;
+      backends[i++] = {
+        name: b.name,
+        type: b.type,
+        enabled: b.enabled,
+        priority: b.priority,
+        description: b.description,
+        icon: b.icon || null,
+        model: b.config?.model || null,
+        healthy: this.adapters.get(b.name)?.lastHealth?.healthy ?? null
+      };
+    }
 
     return {
-      totalBackends: total,
+      totalBackends: this.backends.size,
       enabledBackends: enabled,
       healthyBackends: healthy,
       unknownBackends: unknown,
-      healthChecked: unknown < adapterList.length,
+      healthChecked: unknown < this.adapters.size,
       fallbackChain: this.fallbackChain,
-      backends: Array.from(this.backends.values()).map(b => {
-        const adapter = this.adapters.get(b.name);
-        return {
-          name: b.name,
-          type: b.type,
-          enabled: b.enabled,
-          priority: b.priority,
-          description: b.description,
-          icon: b.icon || null,
-          model: b.config?.model || null,
-          healthy: adapter?.lastHealth?.healthy ?? null
-        };
-      })
+      backends
     };
   }
 
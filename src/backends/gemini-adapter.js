@@ -127,7 +127,7 @@ class GeminiAdapter extends BackendAdapter {
       }],
       generationConfig: {
         maxOutputTokens: options.maxTokens || this.config.maxTokens,
-        temperature: options.temperature || 0.7
+        temperature: options.temperature ?? 0.7
       }
     };
 
@@ -36,7 +36,7 @@ class GroqAdapter extends BackendAdapter {
       model: this.model,
       messages: [{ role: 'user', content: prompt }],
       max_tokens: options.maxTokens || this.config.maxTokens,
-      temperature: options.temperature || 0.7
+      temperature: options.temperature ?? 0.7
     };
 
     const data = await this.makeAPICall(body, 'Groq error');
@@ -52,6 +52,7 @@ class LocalAdapter extends BackendAdapter {
     // Track initialization state
     this.initialized = false;
     this.initializing = false;
+    this.initPromise = null; // In-flight discovery, shared by concurrent callers
 
     // Start autodiscovery in background
     if (!config.skipAutodiscovery) {
@@ -61,11 +62,25 @@ class LocalAdapter extends BackendAdapter {
 
   /**
    * Initialize endpoint via autodiscovery (async, non-blocking)
-   * Also fetches model info dynamically from /v1/models
+   * Also fetches model info dynamically from /v1/models.
+   * Concurrent callers share the in-flight discovery.
    */
   async initializeEndpoint() {
-    if (this.initialized || this.initializing) return;
+    if (this.initialized) return;
+
+    if (!this.initPromise) {
+      this.initPromise = this.discoverEndpoint().finally(() => {
+        this.initPromise = null;
+      });
+    }
+    return this.initPromise;
+  }
 
+  /**
+   * Run endpoint autodiscovery once
+   * @private
+   */
+  async discoverEndpoint() {
     this.initializing = true;
 
     try {
@@ -144,12 +159,14 @@ class LocalAdapter extends BackendAdapter {
             this.model = defaultModel.id;
             this.modelId = defaultModel.id;
 
-            console.error(`[SAB] LocalAdapter: ${availableModels.length} model(s) available:`);
-            this.availableModels.forEach(m => {
+            // Build the listing and emit it as one stderr write rather than one per model
+            const lines = [`[SAB] LocalAdapter: ${availableModels.length} model(s) available:`];
+            for (const m of this.availableModels) {
               const marker = m.id === this.modelId ? ' (DEFAULT)' : '';
               const statusMarker = m.status === 'loaded' ? ' [loaded]' : '';
-              console.error(`   - ${m.id}: ${m.nCtx}ctx, ${m.slots} slots${statusMarker}${marker}`);
-            });
+              lines.push(`   - ${m.id}: ${m.nCtx}ctx, ${m.slots} slots${statusMarker}${marker}`);
+            }
+            console.error(lines.join('\n'));
           } else {
             // Fallback if no models loaded
             this.availableModels = [{ id: data.data[0].id, nCtx: 4096, slots: 1, status: 'unknown' }];
@@ -267,13 +284,8 @@ class LocalAdapter extends BackendAdapter {
   async ensureInitialized() {
     if (this.initialized) return;
 
-    while (this.initializing) {
-      await new Promise(resolve => setTimeout(resolve, 100));
-    }
-
-    if (!this.initialized) {
-      await this.initializeEndpoint();
-    }
+    // Joins an in-flight discovery rather than polling for it to finish
+    await this.initializeEndpoint();
   }
 
   /**
@@ -436,7 +448,7 @@ class LocalAdapter extends BackendAdapter {
     const body = {
       model: modelToUse,
       messages: [{ role: 'user', content: prompt }],
-      temperature: options.temperature || 0.7,
+      temperature: options.temperature ?? 0.7,
       stream: false
     };
 
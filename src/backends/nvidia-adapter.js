@@ -105,7 +105,7 @@ class NvidiaDeepSeekAdapter extends BackendAdapter {
       model,
       messages: [{ role: 'user', content: prompt }],
       max_tokens: options.maxTokens || this.config.maxTokens,
-      temperature: isTerminus ? 0.2 : (options.temperature || 1),
+      temperature: isTerminus ? 0.2 : (options.temperature ?? 1),
       top_p: isTerminus ? 0.7 : 0.95,
       stream: false
     };
@@ -188,7 +188,7 @@ class NvidiaGlmAdapter extends BackendAdapter {
       model: this.model,
       messages: [{ role: 'user', content: prompt }],
       max_tokens: options.maxTokens || this.config.maxTokens,
-      temperature: options.temperature || 0.7,
+      temperature: options.temperature ?? 0.7,
       top_p: options.top_p || 0.8,
       stream: false
     };
@@ -35,7 +35,7 @@ class OpenAIAdapter extends BackendAdapter {
       model: this.model,
       messages: [{ role: 'user', content: prompt }],
       max_tokens: options.maxTokens || 4096,
-      temperature: options.temperature || 0.7
+      temperature: options.temperature ?? 0.7
     };
 
     const data = await this.makeAPICall(body, 'OpenAI error');
@@ -65,31 +65,34 @@ export async function auditReadiness({ backendsConfig, councilConfig, timeoutMs
       config: def.config ?? {}
     }));
 
-  let checked = 0;
+  // Holds in-flight catalog promises so backends sharing a host fetch it once
   const catalogCache = new Map();
-
-  for (const e of entries) {
+  const results = await Promise.all(entries.map(async (e) => {
     if (isLocalEndpoint(e.url ?? '')) {
-      checked++;
       const r = await checkLocalReachable(e.url, timeoutMs);
-      if (r.error) findings.push({ severity: 'critical', backend: e.name, model: e.model, reason: `local endpoint unreachable (${r.error})` });
-      continue;
+      return { checked: true, finding: r.error ? { severity: 'critical', backend: e.name, model: e.model, reason: `local endpoint unreachable (${r.error})` } : null };
     }
 
     const envVar = PROVIDER_ENDPOINTS[e.type]?.envVar ?? null;
     const key = resolveBackendKey(e.config, envVar);
     if (!key) {
-      findings.push({ severity: 'unknown', backend: e.name, model: e.model, reason: `cannot verify — ${envVar ?? 'API key'} not set` });
-      continue;
+      return { checked: false, finding: { severity: 'unknown', backend: e.name, model: e.model, reason: `cannot verify — ${envVar ?? 'API key'} not set` } };
     }
 
     const catUrl = e.url ? catalogUrlFor(e.url) : null;
-    if (!catUrl) { checked++; continue; }
-    if (!catalogCache.has(catUrl)) catalogCache.set(catUrl, await fetchCatalog(catUrl, key, timeoutMs));
-    checked++;
-    const cat = catalogCache.get(catUrl);
-    if (cat.error) findings.push({ severity: 'unknown', backend: e.name, model: e.model, reason: `catalog unreachable (${cat.error})` });
-    else if (e.model && !cat.ids.includes(e.model)) findings.push({ severity: 'critical', backend: e.name, model: e.model, reason: 'model is NOT in the provider catalog — likely retired or renamed' });
+    if (!catUrl) return { checked: true, finding: null };
+    if (!catalogCache.has(catUrl)) catalogCache.set(catUrl, fetchCatalog(catUrl, key, timeoutMs));
+    const cat = await catalogCache.get(catUrl);
+    if (cat.error) return { checked: true, finding: { severity: 'unknown', backend: e.name, model: e.model, reason: `catalog unreachable (${cat.error})` } };
+    if (e.model && !cat.ids.includes(e.model)) return { checked: true, finding: { severity: 'critical', backend: e.name, model: e.model, reason: 'model is NOT in the provider catalog — likely retired or renamed' } };
+    return { checked: true, finding: null };
+  }));
+
+  // Collected in config order so the report reads the same as a serial audit
+  let checked = 0;
+  for (const r of results) {
+    if (r.checked) checked++;
+    if (r.finding) findings.push(r.finding);
   }
 
   const defined = new Set(entries.map(e => e.name));
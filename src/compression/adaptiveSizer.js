@@ -187,11 +187,15 @@ export function computeUniqueBigramCurve(items) {
  * Uses character 4-grams hashed to 64-bit values, then aggregates
  * via weighted bit voting.
  *
+ * The 64-bit value is handled as two unsigned 32-bit halves: bit voting and
+ * popcount then run on plain integers instead of allocating a BigInt per bit
+ * per gram, which dominated the crusher's runtime.
+ *
  * @param {string} text - Input text.
- * @returns {bigint} 64-bit integer fingerprint.
+ * @returns {Uint32Array} Fingerprint as [low 32 bits, high 32 bits].
  */
 function _simhash(text) {
-  const v = new Array(64).fill(0);
+  const v = new Int32Array(64);
   const textLower = text.toLowerCase();
 
   // Character 4-grams
@@ -201,45 +205,47 @@ function _simhash(text) {
   for (let i = 0; i < limit; i++) {
     const gram = textLower.slice(i, i + 4);
 
-    // MD5 hash of the gram, take the first 16 hex chars
-    const digest = createHash('md5').update(gram).digest('hex').slice(0, 16);
-    // Convert hex string to BigInt
-    const h = BigInt(`0x${digest}`);
-
-    for (let j = 0; j < 64; j++) {
-      // Check j-th bit (0-indexed)
-      if (h & (1n << BigInt(j))) {
-        v[j] += 1;
-      } else {
-        v[j] -= 1;
-      }
+    // MD5 hash of the gram, take the first 8 bytes (16 hex chars) big-endian
+    const digest = createHash('md5').update(gram).digest();
+    const high = digest.readUInt32BE(0);
+    const low = digest.readUInt32BE(4);
+
+    for (let j = 0; j < 32; j++) {
+      v[j] += ((low >>> j) & 1) ? 1 : -1;
+      v[j + 32] += ((high >>> j) & 1) ? 1 : -1;
     }
   }
 
-  let fingerprint = 0n;
-  for (let j = 0; j < 64; j++) {
-    if (v[j] > 0) {
-      fingerprint |= (1n << BigInt(j));
-    }
+  let low = 0;
+  let high = 0;
+  for (let j = 0; j < 32; j++) {
+    if (v[j] > 0) low |= (1 << j);
+    if (v[j + 32] > 0) high |= (1 << j);
   }
-  return fingerprint;
+  return Uint32Array.of(low, high);
 }
 
 /**
- * Counts differing bits between two 64-bit BigInts.
- *
- * Uses Brian Kernighan loop logic implicitly via BigInt XOR and string counting.
+ * Counts set bits in a 32-bit integer (SWAR popcount).
+ * @param {number} x
+ * @returns {number}
+ */
+function _popcount32(x) {
+  x = x - ((x >>> 1) & 0x55555555);
+  x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+  x = (x + (x >>> 4)) & 0x0f0f0f0f;
+  return Math.imul(x, 0x01010101) >>> 24;
+}
+
+/**
+ * Counts differing bits between two 64-bit fingerprints.
  *
- * @param {bigint} a - First fingerprint.
- * @param {bigint} b - Second fingerprint.
+ * @param {Uint32Array} a - First fingerprint.
+ * @param {Uint32Array} b - Second fingerprint.
  * @returns {number} Hamming distance (popcount).
  */
 function _hammingDistance(a, b) {
-  const xorResult = a ^ b;
-
-  // Efficiently count set bits in a BigInt
-  // Convert to binary string and count '1's
-  return xorResult.toString(2).split('1').length - 1;
+  return _popcount32(a[0] ^ b[0]) + _popcount32(a[1] ^ b[1]);
 }
 
 /**
@@ -39,6 +39,8 @@ export const CCR_SENTINEL_KEY = '_ccr_dropped';
  * @property {number} lastFraction - Fraction of items kept from the end (0.0 to 1.0).
  * @property {number} bias - Bias multiplier applied to the Kneedle result (1.0 is standard).
  * @property {number} maxDepth - Maximum recursion depth for crushing nested objects/arrays.
+ * @property {boolean} measureTokens - Whether to fill originalTokens/compressedTokens in the stats
+ *   (each costs a full JSON.stringify of the value; callers that discard stats can turn it off).
  */
 
 /**
@@ -54,6 +56,7 @@ export const DEFAULT_CRUSHER_CONFIG = {
   lastFraction: 0.15,
   bias: 1.0,
   maxDepth: 5,
+  measureTokens: true,
 };
 
 /**
@@ -93,19 +96,6 @@ function ccrStorePut(hash, original) {
   _ccrStore.set(hash, original);
 }
 
-/**
- * JSON.stringify that never throws (circular refs, BigInt, etc. -> '').
- * @param {unknown} v
- * @returns {string}
- */
-function safeStringify(v) {
-  try {
-    return JSON.stringify(v) ?? '';
-  } catch {
-    return '';
-  }
-}
-
 /**
  * Internal: Estimates the token count of a value.
  * Uses a rough approximation based on string length (4 characters per token).
@@ -122,14 +112,37 @@ function estimateTokens(v) {
   }
 }
 
+const IMPORTANT_PATTERN = /\b(error|fail|failure|exception|fatal|warn|warning|critical)\b/i;
+
 /**
- * Internal: Checks if an item contains keywords indicating importance.
- * @param {unknown} item - The item to test.
+ * Internal: Checks if a serialized item contains keywords indicating importance.
+ * @param {string} itemString - The item's JSON serialization.
  * @returns {boolean} True if the item is considered important.
  */
-function isImportant(item) {
-  const str = safeStringify(item);
-  return /\b(error|fail|failure|exception|fatal|warn|warning|critical)\b/i.test(str);
+function isImportant(itemString) {
+  return IMPORTANT_PATTERN.test(itemString);
+}
+
+/**
+ * Internal: Serializes each item of an array exactly once.
+ *
+ * crushArray needs every item's JSON three ways — the token estimate, the
+ * importance scan and the CCR hash — so serializing once and deriving the rest
+ * avoids stringifying every record (and the whole array) several times over.
+ * Returns null when any item cannot be serialized (circular refs, BigInt, ...).
+ *
+ * @param {unknown[]} arr - Array of records.
+ * @returns {string[] | null} Per-item JSON strings.
+ */
+function stringifyItems(arr) {
+  try {
+    // Unrepresentable elements (undefined, functions, holes) feed the sizer and
+    // importance scan as ''. JSON.stringify never yields '' for a real value, so
+    // callers can still render them as 'null' when rebuilding the array's JSON.
+    return Array.from(arr, x => JSON.stringify(x) ?? '');
+  } catch {
+    return null;
+  }
 }
 
 /**
@@ -165,13 +178,21 @@ function crushArray(arr, cfg, stats) {
     return arr;
   }
 
-  const originalTokens = estimateTokens(arr);
+  // 2. Serialize once; JSON.stringify(arr) is exactly '[' + items.join(',') + ']'
+  const itemStrings = stringifyItems(arr);
+  if (!itemStrings) {
+    return arr;
+  }
+  let serializedLength = n + 1; // brackets plus n - 1 commas
+  for (const str of itemStrings) {
+    serializedLength += str.length || 4; // '' stands for 'null' in the array's JSON
+  }
+  const originalTokens = Math.ceil(serializedLength / 4);
   if (originalTokens < cfg.minTokensToCrush) {
     return arr;
   }
 
-  // 2. Tokenization and Sizing
-  const itemStrings = arr.map(x => JSON.stringify(x) ?? '');
+  // 3. Sizing
 
   // Use adaptive sizer to find optimal K
   const k = computeOptimalK(itemStrings, cfg.bias, 3, cfg.maxItemsAfterCrush);
@@ -181,12 +202,12 @@ function crushArray(arr, cfg, stats) {
     return arr;
   }
 
-  // 3. Determine Keep Indices
+  // 4. Determine Keep Indices
   const keepIndices = new Set();
 
   // A. Important items
   for (let i = 0; i < n; i++) {
-    if (isImportant(arr[i])) {
+    if (isImportant(itemStrings[i])) {
       keepIndices.add(i);
     }
   }
@@ -207,7 +228,7 @@ function crushArray(arr, cfg, stats) {
     }
   }
 
-  // 4. Fill remaining K slots
+  // 5. Fill remaining K slots
   const sortedKeepIndices = Array.from(keepIndices).sort((a, b) => a - b);
   let remainingIndices = new Set();
   for (let i = 0; i < n; i++) {
@@ -228,7 +249,7 @@ function crushArray(arr, cfg, stats) {
   // Re-sort so filled middle indices stay in original document order
   sortedKeepIndices.sort((a, b) => a - b);
 
-  // 5. Build the Result Array
+  // 6. Build the Result Array
   const kept = sortedKeepIndices.map(i => arr[i]);
   const droppedCount = n - kept.length;
 
@@ -237,15 +258,11 @@ function crushArray(arr, cfg, stats) {
     return arr;
   }
 
-  // 6. Hash and Store the pristine original (best-effort; skip if unserializable)
-  const base = safeStringify(arr);
-  if (!base) {
-    return arr;
-  }
-  const hash = shortHash(base);
+  // 7. Hash and Store the pristine original
+  const hash = shortHash(`[${itemStrings.map(str => str || 'null').join(',')}]`);
   ccrStorePut(hash, arr);
 
-  // 7. Update Stats and Return
+  // 8. Update Stats and Return
   stats.arraysCrushed += 1;
   stats.itemsDropped += droppedCount;
 
@@ -361,7 +378,7 @@ export function crushToolResult(value, config) {
 
   // Initialize statistics
   const stats = {
-    originalTokens: estimateTokens(value),
+    originalTokens: cfg.measureTokens ? estimateTokens(value) : 0,
     compressedTokens: 0,
     arraysCrushed: 0,
     itemsDropped: 0,
@@ -377,7 +394,7 @@ export function crushToolResult(value, config) {
   const crushed = crushValue(value, cfg, stats, 0);
 
   // 3. Finalize Statistics
-  stats.compressedTokens = estimateTokens(crushed);
+  stats.compressedTokens = cfg.measureTokens ? estimateTokens(crushed) : 0;
 
   return { value: crushed, stats };
 }
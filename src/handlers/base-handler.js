@@ -14,6 +14,7 @@ import { promises as fs } from 'fs';
 import { PlaybookSystem } from '../intelligence/playbook-system.js';
 import { detectLanguage } from '../utils/language-detector.js';
 import { getLocalContextLimit } from '../utils/model-discovery.js';
+import { levenshteinDistance } from '../utils/levenshtein.js';
 
 const RETRY_CONFIG = {
   maxLocalRetries: 2,
@@ -205,24 +206,29 @@ class BaseHandler {
     const lines = text.split('\n');
     if (lines.length < 20) return text;
 
+    // Normalize each line once; the compaction pass below reuses these keys.
+    // Track the max repeat while counting (spreading freq.values() into
+    // Math.max would also overflow the call stack on very long outputs).
     const normalized = lines.map(l => l.trim().toLowerCase().replace(/\s+/g, ' '));
     const freq = new Map();
+    let maxRepeat = 0;
     for (const line of normalized) {
       if (!line) continue;
-      freq.set(line, (freq.get(line) || 0) + 1);
+      const count = (freq.get(line) || 0) + 1;
+      freq.set(line, count);
+      if (count > maxRepeat) maxRepeat = count;
     }
 
-    const maxRepeat = Math.max(0, ...freq.values());
     if (maxRepeat < 6) return text;
 
     const seen = new Set();
     const compact = [];
-    for (const line of lines) {
-      const key = line.trim().toLowerCase().replace(/\s+/g, ' ');
-      if (!key) { compact.push(line); continue; }
+    for (let i = 0; i < lines.length; i++) {
+      const key = normalized[i];
+      if (!key) { compact.push(lines[i]); continue; }
       if (seen.has(key)) continue;
       seen.add(key);
-      compact.push(line);
+      compact.push(lines[i]);
       if (compact.length >= 400) break;
     }
     compact.push('[Output compacted: repetitive lines removed]');
@@ -417,31 +423,7 @@ class BaseHandler {
    * @returns {number}
    */
   levenshteinDistance(str1, str2) {
-    const matrix = [];
-
-    for (let i = 0; i <= str2.length; i++) {
-      matrix[i] = [i];
-    }
-
-    for (let j = 0; j <= str1.length; j++) {
-      matrix[0][j] = j;
-    }
-
-    for (let i = 1; i <= str2.length; i++) {
-      for (let j = 1; j <= str1.length; j++) {
-        if (str2.charAt(i - 1) === str1.charAt(j - 1)) {
-          matrix[i][j] = matrix[i - 1][j - 1];
-        } else {
-          matrix[i][j] = Math.min(
-            matrix[i - 1][j - 1] + 1, // substitution
-            matrix[i][j - 1] + 1,     // insertion
-            matrix[i - 1][j] + 1      // deletion
-          );
-        }
-      }
-    }
-
-    return matrix[str2.length][str1.length];
+    return levenshteinDistance(str1, str2);
   }
 
   /**
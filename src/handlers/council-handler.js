@@ -13,6 +13,7 @@
 import { BaseHandler } from './base-handler.js';
 import { configManager, VALID_TOPICS } from '../config/council-config-manager.js';
 import { CouncilMetrics } from '../monitoring/council-metrics.js';
+import { INFO_LOGGING } from '../utils/log-level.js';
 
 /**
  * Available council modes
@@ -126,7 +127,7 @@ class CouncilHandler extends BaseHandler {
       // Get strategy from config
       const strategy = configManager.getStrategyForTopic(topic);
 
-      console.error(`[Council] Topic: ${topic}, Strategy: ${strategy}, Confidence: ${confidence_needed}, Backends: ${availableBackends.join(', ')}`);
+      if (INFO_LOGGING) console.error(`[Council] Topic: ${topic}, Strategy: ${strategy}, Confidence: ${confidence_needed}, Backends: ${availableBackends.join(', ')}`);
 
       // Dispatch based on strategy
       let responses;
@@ -285,7 +286,7 @@ class CouncilHandler extends BaseHandler {
     const allResponses = [];
     
     for (let round = 1; round <= rounds; round++) {
-      console.error(`[Council] Debate round ${round}/${rounds}`);
+      if (INFO_LOGGING) console.error(`[Council] Debate round ${round}/${rounds}`);
       
       const roundPrompt = round === 1 
         ? currentContext 
@@ -562,7 +563,7 @@ SYNTHESIS: [Final unified answer]`;
     const allResponses = [];
 
     for (let round = 1; round <= rounds; round++) {
-      console.error(`[Council] Debate round ${round}/${rounds}`);
+      if (INFO_LOGGING) console.error(`[Council] Debate round ${round}/${rounds}`);
 
       const roundPrompt = round === 1
         ? prompt
@@ -599,7 +600,7 @@ SYNTHESIS: [Final unified answer]`;
 
         // Stop once we have enough successful responses
         if (responses.filter(r => r.success).length >= minSuccessful) {
-          console.error(`[Council] Fallback: ${minSuccessful} backends succeeded, stopping`);
+          if (INFO_LOGGING) console.error(`[Council] Fallback: ${minSuccessful} backends succeeded, stopping`);
           break;
         }
       } catch (error) {
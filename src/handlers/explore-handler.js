@@ -8,6 +8,7 @@
 import { BaseHandler } from './base-handler.js';
 import { promises as fs } from 'fs';
 import path from 'path';
+import { INFO_LOGGING } from '../utils/log-level.js';
 
 
 // Default ignore patterns for common non-code directories
@@ -75,11 +76,11 @@ export class ExploreHandler extends BaseHandler {
         }, 0);
       }
 
-      console.error(`[ExploreHandler] Searching for patterns: ${searchPatterns.join(', ')}`);
+      if (INFO_LOGGING) console.error(`[ExploreHandler] Searching for patterns: ${searchPatterns.join(', ')}`);
 
       // 3. Find files matching scope using glob
       const files = await this.findFiles(scope, maxFiles);
-      console.error(`[ExploreHandler] Found ${files.length} files to search`);
+      if (INFO_LOGGING) console.error(`[ExploreHandler] Found ${files.length} files to search`);
 
       // 4. Search files based on depth
       let findings;
@@ -101,9 +102,8 @@ export class ExploreHandler extends BaseHandler {
       );
 
       // Measured against the actual finished response (envelope + pretty-print
-      // included, and the real LLM summary text) — findings.tokensSaved above
-      // only covers the evidence/filesFound subset and is computed before the
-      // summary and envelope exist, so it is not what's used here.
+      // included, and the real LLM summary text) — findings.tokensSaved only
+      // covers the evidence/filesFound subset, so it is not what's used here.
       return this.buildSuccessResponseWithSavings({
         summary,
         files_found: findings.filesFound,
@@ -211,20 +211,7 @@ export class ExploreHandler extends BaseHandler {
       }
     }
 
-    const filesFoundArr = Array.from(filesFound);
-    return {
-      evidence,
-      filesFound: filesFoundArr,
-      totalChars, // real chars read — the final response (execute()) measures against this
-      // Measured against the evidence/file list actually handed back to the
-      // caller, not the full totalChars read — counting the whole input as
-      // "saved" ignores the size of what we're actually returning. Kept for
-      // internal/diagnostic use; the tokens_saved actually returned to the
-      // caller is computed in execute() against the finished response (see
-      // buildSuccessResponseWithSavings), which also counts the LLM summary
-      // and the response envelope.
-      tokensSaved: this.measureTokensSaved(totalChars, { evidence, filesFound: filesFoundArr }).tokensSaved
-    };
+    return this.buildFindings(evidence, Array.from(filesFound), totalChars);
   }
 
   /**
@@ -276,14 +263,26 @@ export class ExploreHandler extends BaseHandler {
       }
     }
 
-    const filesFoundArr = Array.from(filesFound);
-    return {
-      evidence,
-      filesFound: filesFoundArr,
-      totalChars, // real chars read — the final response (execute()) measures against this
-      // Same treatment as performShallowSearch (see comment above).
-      tokensSaved: this.measureTokensSaved(totalChars, { evidence, filesFound: filesFoundArr }).tokensSaved
-    };
+    return this.buildFindings(evidence, Array.from(filesFound), totalChars);
+  }
+
+  /**
+   * Package search results for execute()
+   * @param {Array} evidence - Matches handed back to the caller
+   * @param {string[]} filesFound - Files with at least one match
+   * @param {number} totalChars - Real chars read; the final response measures against this
+   * @returns {{evidence: Array, filesFound: string[], totalChars: number, tokensSaved: number}}
+   */
+  buildFindings(evidence, filesFound, totalChars) {
+    const findings = { evidence, filesFound, totalChars };
+    // Measured against the evidence/file list handed back, not the full totalChars
+    // read. Diagnostic only — execute() reports the saving measured on the finished
+    // response — so it is computed on access rather than serializing every search.
+    Object.defineProperty(findings, 'tokensSaved', {
+      enumerable: true,
+      get: () => this.measureTokensSaved(totalChars, { evidence, filesFound }).tokensSaved
+    });
+    return findings;
   }
 
   /**
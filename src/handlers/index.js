@@ -60,6 +60,13 @@ const HANDLER_REGISTRY = {
   'handleDualIterate': DualIterateHandler
 };
 
+/**
+ * Lookup form of HANDLER_REGISTRY. A Map has no prototype chain, so names like
+ * 'toString' or 'constructor' can't resolve to Object.prototype members.
+ * @type {Map<string, typeof BaseHandler>}
+ */
+const HANDLER_CLASSES = new Map(Object.entries(HANDLER_REGISTRY));
+
 /**
  * Create handler instance by name
  * @param {string} handlerName - Handler name from tool definition
@@ -67,7 +74,7 @@ const HANDLER_REGISTRY = {
  * @returns {BaseHandler|null}
  */
 function createHandler(handlerName, context) {
-  const HandlerClass = HANDLER_REGISTRY[handlerName];
+  const HandlerClass = HANDLER_CLASSES.get(handlerName);
   if (!HandlerClass) {
     return null;
   }
@@ -88,7 +95,7 @@ function getAvailableHandlers() {
  * @returns {boolean}
  */
 function hasHandler(handlerName) {
-  return handlerName in HANDLER_REGISTRY;
+  return HANDLER_CLASSES.has(handlerName);
 }
 
 /**
@@ -113,13 +120,16 @@ class HandlerFactory {
    * @returns {BaseHandler|null}
    */
   getHandler(handlerName) {
-    if (!this.instances.has(handlerName)) {
-      const handler = createHandler(handlerName, this.context);
-      if (handler) {
-        this.instances.set(handlerName, handler);
-      }
+    // Hot path: one Map lookup per tool call once the handler exists
+    const cached = this.instances.get(handlerName);
+    if (cached) {
+      return cached;
+    }
+    const handler = createHandler(handlerName, this.context);
+    if (handler) {
+      this.instances.set(handlerName, handler);
     }
-    return this.instances.get(handlerName) || null;
+    return handler;
   }
 
   /**
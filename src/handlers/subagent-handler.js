@@ -21,6 +21,7 @@ import {
   getBackendCapabilities,
   isSuitableForSubagent
 } from '../utils/capability-matcher.js';
+import { DEBUG_LOGGING, INFO_LOGGING } from '../utils/log-level.js';
 
 /**
  * Handler for spawning specialized subagents
@@ -478,15 +479,15 @@ class SubagentHandler extends BaseHandler {
 
     // Step 1: Estimate task context requirements
     const contextSize = estimateTaskContextSize(task, filePatterns);
-    console.error(`[Subagent] Task context size: ${contextSize}`);
+    if (INFO_LOGGING) console.error(`[Subagent] Task context size: ${contextSize}`);
 
     // Step 2: Get available backends (exclude non-capable backends)
     const availableBackends = await this.getAvailableBackendsForSubagent();
-    console.error(`[Subagent] Available backends: ${availableBackends.join(', ')}`);
+    if (INFO_LOGGING) console.error(`[Subagent] Available backends: ${availableBackends.join(', ')}`);
 
     // Step 3: Pre-fetch local capabilities (CRITICAL: must await initialization)
     const localCaps = await this.getLocalCapabilities();
-    console.error(`[Subagent] Pre-fetched local capabilities:`, localCaps);
+    if (INFO_LOGGING) console.error(`[Subagent] Pre-fetched local capabilities:`, localCaps);
 
     // Step 4: Use capability matching to find best backend
     const result = findBestBackend({
@@ -498,7 +499,7 @@ class SubagentHandler extends BaseHandler {
       getLocalCapabilities: () => localCaps  // Return pre-fetched (no async needed)
     });
 
-    console.error(`[Subagent] Selected backend: ${result.backend} (${result.reason})`);
+    if (INFO_LOGGING) console.error(`[Subagent] Selected backend: ${result.backend} (${result.reason})`);
     return result.backend || 'local';
   }
 
@@ -554,20 +555,20 @@ class SubagentHandler extends BaseHandler {
    */
   async getLocalCapabilities() {
     const localAdapter = this.getLocalAdapter();
-    console.error('[DEBUG] getLocalCapabilities - localAdapter exists:', !!localAdapter);
+    if (DEBUG_LOGGING) console.error('[DEBUG] getLocalCapabilities - localAdapter exists:', !!localAdapter);
 
     // CRITICAL FIX: Ensure adapter is fully initialized before getting capabilities
     if (localAdapter && localAdapter.ensureInitialized) {
       await localAdapter.ensureInitialized();
-      console.error('[DEBUG] getLocalCapabilities - ensureInitialized() complete');
+      if (DEBUG_LOGGING) console.error('[DEBUG] getLocalCapabilities - ensureInitialized() complete');
     }
 
     if (localAdapter && localAdapter.getModelCapabilities) {
       const caps = localAdapter.getModelCapabilities();
-      console.error('[DEBUG] getLocalCapabilities - returned caps:', caps);
+      if (DEBUG_LOGGING) console.error('[DEBUG] getLocalCapabilities - returned caps:', caps);
       return caps;
     }
-    console.error('[DEBUG] getLocalCapabilities - fallback to [general]');
+    if (DEBUG_LOGGING) console.error('[DEBUG] getLocalCapabilities - fallback to [general]');
     return ['general'];
   }
 
@@ -591,11 +592,11 @@ class SubagentHandler extends BaseHandler {
     const HEALTH_TIMEOUT = 5000; // 5 second timeout for health check
 
     try {
-      console.error(`[DEBUG] isBackendAvailable(${backend}) - checking...`);
+      if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - checking...`);
 
       // PRIORITY 1: Check circuit breaker status first (fast, no network call)
       const adapter = this.context?.router?.backends?.getAdapter?.(backend);
-      console.error(`[DEBUG] isBackendAvailable(${backend}) - adapter exists:`, !!adapter, 'circuitOpen:', adapter?.circuitOpen);
+      if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - adapter exists:`, !!adapter, 'circuitOpen:', adapter?.circuitOpen);
       if (adapter?.circuitOpen) {
         console.error(`[SubagentHandler] Backend ${backend} skipped - circuit breaker open`);
         return false;
@@ -604,27 +605,27 @@ class SubagentHandler extends BaseHandler {
       // Use router's backend availability check if available
       if (this.context?.router?.isBackendAvailable) {
         const result = await this.context.router.isBackendAvailable(backend);
-        console.error(`[DEBUG] isBackendAvailable(${backend}) - router check result:`, result);
+        if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - router check result:`, result);
         return result;
       }
 
       // For local backend, do a quick health ping
       if (backend === 'local') {
         const result = await this.checkLocalHealth(HEALTH_TIMEOUT);
-        console.error(`[DEBUG] isBackendAvailable(${backend}) - checkLocalHealth result:`, result);
+        if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - checkLocalHealth result:`, result);
         return result;
       }
 
       // For NVIDIA backends, check with cached health status
       if (backend.startsWith('nvidia_')) {
         const result = await this.checkNvidiaHealth(backend, HEALTH_TIMEOUT);
-        console.error(`[DEBUG] isBackendAvailable(${backend}) - checkNvidiaHealth result:`, result);
+        if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - checkNvidiaHealth result:`, result);
         return result;
       }
 
       // For other backends (gemini, groq), assume available
       // They have their own timeout handling in adapters
-      console.error(`[DEBUG] isBackendAvailable(${backend}) - assumed available`);
+      if (DEBUG_LOGGING) console.error(`[DEBUG] isBackendAvailable(${backend}) - assumed available`);
       return true;
     } catch (e) {
       console.error(`[SubagentHandler] Health check failed for ${backend}:`, e.message);
@@ -100,15 +100,20 @@ class HealthHandler extends BaseHandler {
 
     // Get backend health from registry
     if (this.context.backendRegistry && check_type !== 'system') {
-      const backends = this.context.backendRegistry.getAllBackends();
-      for (const [key, backend] of Object.entries(backends)) {
+      const entries = Object.entries(this.context.backendRegistry.getAllBackends());
+
+      // Probe concurrently; results stay index-aligned with entries
+      const availability = await Promise.all(entries.map(async ([key]) => {
         const adapter = this.context.backendRegistry.getAdapter(key);
-        let isHealthy = false;
         try {
-          isHealthy = adapter ? await adapter.isAvailable() : false;
+          return adapter ? await adapter.isAvailable() : false;
         } catch (e) {
-          isHealthy = false;
+          return false;
         }
+      }));
+
+      for (const [index, [key, backend]] of entries.entries()) {
+        const isHealthy = availability[index];
         if (isHealthy) {
           healthData.multi_ai_status.healthy_backends++;
         }
@@ -277,16 +282,16 @@ class GetAnalyticsHandler extends BaseHandler {
           break;
 
         case 'full_report':
-          const reportStr = await this.context.usageAnalytics.exportReport(format, time_range);
           if (format === 'markdown') {
             return {
               content: [{
                 type: 'text',
-                text: reportStr
+                text: await this.context.usageAnalytics.exportReport(format, time_range)
               }]
             };
           }
-          result = JSON.parse(reportStr);
+          // Embed the report object directly; it is serialized once below
+          result = await this.context.usageAnalytics.buildReport(time_range);
           break;
 
         default:
@@ -18,6 +18,9 @@ const TOOL_WEIGHTS = {
   generate: 0.7,
 };
 
+// keywordDensity saturates at this many distinct keyword hits
+const KEYWORD_SATURATION = 5;
+
 const LENGTH_THRESHOLDS = { low: 200, mid: 800, high: 2000 };
 const FILE_SIZE_THRESHOLDS = { mid: 5000, high: 20000 };
 
@@ -32,18 +35,23 @@ const FILE_SIZE_THRESHOLDS = { mid: 5000, high: 20000 };
  */
 export function scoreComplexity({ prompt, fileSize = 0, fileCount = 1, toolType = 'ask' }) {
   const factors = {};
+  const text = prompt || '';
 
   // 1. Instruction length (0.0-1.0, weight 0.25)
-  const len = (prompt || '').length;
+  const len = text.length;
   if (len >= LENGTH_THRESHOLDS.high) factors.length = 1.0;
   else if (len >= LENGTH_THRESHOLDS.mid) factors.length = 0.6;
   else if (len >= LENGTH_THRESHOLDS.low) factors.length = 0.3;
   else factors.length = 0.1;
 
   // 2. Keyword density (0.0-1.0, weight 0.25)
-  const lower = (prompt || '').toLowerCase();
-  const hits = COMPLEXITY_KEYWORDS.filter(kw => lower.includes(kw)).length;
-  factors.keywordDensity = Math.min(hits / 5, 1.0);
+  // Stop scanning once saturated; the count is then already in range, no clamp needed
+  const lower = text.toLowerCase();
+  let hits = 0;
+  for (let i = 0; i < COMPLEXITY_KEYWORDS.length && hits < KEYWORD_SATURATION; i++) {
+    if (lower.includes(COMPLEXITY_KEYWORDS[i])) hits++;
+  }
+  factors.keywordDensity = hits / KEYWORD_SATURATION;
 
   // 3. File size (0.0-1.0, weight 0.15)
   if (fileSize >= FILE_SIZE_THRESHOLDS.high) factors.fileSize = 1.0;
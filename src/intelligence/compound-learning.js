@@ -60,6 +60,16 @@ const FeedbackType = {
   ERROR: 'error'                // Execution error
 };
 
+/**
+ * Success score at or above which an outcome counts as a successful call
+ */
+const SUCCESS_THRESHOLD = 0.7;
+
+/**
+ * Per-backend outcomes considered by trend detection
+ */
+const TREND_WINDOW = 20;
+
 /**
  * Compound Learning Engine
  * Tracks backend performance and learns optimal routing patterns
@@ -82,12 +92,14 @@ class CompoundLearningEngine {
     this.taskPatterns = {};      // Task pattern → outcome mapping
     this.routingHistory = [];    // Recent routing decisions
     this.lastDecayTime = Date.now(); // Track last decay application
+    this._trendWindows = new Map();  // backend → last TREND_WINDOW success scores
 
     // Ensure data directory exists
     this._ensureDataDir();
 
     // Load persisted state
     this._loadState();
+    this._rebuildTrendWindows();
 
     // Apply decay on load if enabled
     if (this.config.decayEnabled) {
@@ -246,12 +258,13 @@ class CompoundLearningEngine {
     const successScore = success ? 1.0 : 0.0;
 
     // Update backend metrics with EMA
-    this._updateBackendMetrics(backend, successScore, latency, context);
+    this._updateBackendMetrics(backend, successScore, latency, context, timestamp);
 
     // Learn task patterns
-    this._learnTaskPattern(context, backend, successScore);
+    this._learnTaskPattern(context, backend, successScore, timestamp);
 
     // Add to history
+    this._pushTrendSample(backend, successScore);
     this.routingHistory.push({
       timestamp,
       backend,
@@ -267,6 +280,8 @@ class CompoundLearningEngine {
     // Keep history manageable
     if (this.routingHistory.length > 1000) {
       this.routingHistory = this.routingHistory.slice(-500);
+      // Trend windows must only see outcomes that survived the trim
+      this._rebuildTrendWindows();
     }
 
     // Persist state periodically
@@ -285,7 +300,7 @@ class CompoundLearningEngine {
    * Update backend metrics using Exponential Moving Average
    * @private
    */
-  _updateBackendMetrics(backend, successScore, latency, context) {
+  _updateBackendMetrics(backend, successScore, latency, context, now = Date.now()) {
     if (!this.backendMetrics[backend]) {
       this.backendMetrics[backend] = {
         confidence: 0.5,
@@ -300,53 +315,47 @@ class CompoundLearningEngine {
         },
         byTaskType: {},
         trend: 'stable',
-        lastUpdated: Date.now()
+        lastUpdated: now
       };
     }
 
     const metrics = this.backendMetrics[backend];
+    const succeeded = successScore >= SUCCESS_THRESHOLD ? 1 : 0;
+
     metrics.totalCalls++;
     metrics.totalLatency += latency;
     metrics.avgLatency = metrics.totalLatency / metrics.totalCalls;
-
-    if (successScore >= 0.7) {
-      metrics.successfulCalls++;
-    }
+    metrics.successfulCalls += succeeded;
 
     // EMA confidence update
     // Formula: new_confidence = alpha * observation + (1 - alpha) * old_confidence
-    metrics.confidence = this.config.emaAlpha * successScore +
-                         (1 - this.config.emaAlpha) * metrics.confidence;
+    const alpha = this.config.emaAlpha;
+    metrics.confidence = alpha * successScore + (1 - alpha) * metrics.confidence;
 
     // Track by complexity
-    const complexity = context.complexity || 'medium';
-    if (metrics.byComplexity[complexity]) {
-      metrics.byComplexity[complexity].calls++;
-      if (successScore >= 0.7) {
-        metrics.byComplexity[complexity].success++;
-      }
+    const complexityStats = metrics.byComplexity[context.complexity || 'medium'];
+    if (complexityStats) {
+      complexityStats.calls++;
+      complexityStats.success += succeeded;
     }
 
     // Track by task type
     const taskType = context.taskType || 'unknown';
-    if (!metrics.byTaskType[taskType]) {
-      metrics.byTaskType[taskType] = { calls: 0, success: 0 };
-    }
-    metrics.byTaskType[taskType].calls++;
-    if (successScore >= 0.7) {
-      metrics.byTaskType[taskType].success++;
-    }
+    const typeStats = metrics.byTaskType[taskType] ||
+      (metrics.byTaskType[taskType] = { calls: 0, success: 0 });
+    typeStats.calls++;
+    typeStats.success += succeeded;
 
     // Calculate trend
     metrics.trend = this._calculateTrend(backend);
-    metrics.lastUpdated = Date.now();
+    metrics.lastUpdated = now;
   }
 
   /**
    * Learn task patterns for future routing
    * @private
    */
-  _learnTaskPattern(context, backend, successScore) {
+  _learnTaskPattern(context, backend, successScore, now = Date.now()) {
     // Create pattern key from context
     const complexity = context.complexity || 'unknown';
     const taskType = context.taskType || 'unknown';
@@ -356,14 +365,14 @@ class CompoundLearningEngine {
       this.taskPatterns[patternKey] = {
         backendPerformance: {},
         totalSamples: 0,
-        createdAt: Date.now(),
-        lastUpdated: Date.now()
+        createdAt: now,
+        lastUpdated: now
       };
     }
 
     const pattern = this.taskPatterns[patternKey];
     pattern.totalSamples++;
-    pattern.lastUpdated = Date.now(); // v1.6.0: Track last update for decay
+    pattern.lastUpdated = now; // v1.6.0: Track last update for decay
 
     if (!pattern.backendPerformance[backend]) {
       pattern.backendPerformance[backend] = { calls: 0, successSum: 0 };
@@ -374,23 +383,53 @@ class CompoundLearningEngine {
   }
 
   /**
-   * Calculate trend from recent history
+   * Append an outcome to the backend's trend window
+   * @private
+   */
+  _pushTrendSample(backend, successScore) {
+    let window = this._trendWindows.get(backend);
+    if (!window) {
+      window = [];
+      this._trendWindows.set(backend, window);
+    }
+    window.push(successScore);
+    if (window.length > TREND_WINDOW) {
+      window.shift();
+    }
+  }
+
+  /**
+   * Seed trend windows from routing history (after load or reset)
+   * @private
+   */
+  _rebuildTrendWindows() {
+    this._trendWindows.clear();
+    for (const h of this.routingHistory) {
+      this._pushTrendSample(h.backend, h.success);
+    }
+  }
+
+  /**
+   * Calculate trend from the backend's recent outcomes.
+   * Reads a bounded per-backend window instead of filtering the whole
+   * routing history on every recorded outcome.
    * @private
    */
   _calculateTrend(backend) {
-    const backendHistory = this.routingHistory
-      .filter(h => h.backend === backend)
-      .slice(-20);
+    const window = this._trendWindows.get(backend);
 
-    if (backendHistory.length < 10) {
+    if (!window || window.length < 10) {
       return 'stable';
     }
 
-    const recentHalf = backendHistory.slice(-5);
-    const olderHalf = backendHistory.slice(0, 5);
-
-    const recentAvg = recentHalf.reduce((sum, h) => sum + h.success, 0) / recentHalf.length;
-    const olderAvg = olderHalf.reduce((sum, h) => sum + h.success, 0) / olderHalf.length;
+    let recentSum = 0;
+    let olderSum = 0;
+    for (let i = 0; i < 5; i++) {
+      olderSum += window[i];
+      recentSum += window[window.length - 1 - i];
+    }
+    const recentAvg = recentSum / 5;
+    const olderAvg = olderSum / 5;
 
     const diff = recentAvg - olderAvg;
 
@@ -567,6 +606,7 @@ class CompoundLearningEngine {
     this.backendMetrics = {};
     this.taskPatterns = {};
     this.routingHistory = [];
+    this._trendWindows.clear();
     this._saveState();
   }
 }
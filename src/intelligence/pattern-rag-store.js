@@ -88,9 +88,13 @@ function cosineSimilarity(vecA, vecB) {
   let magB = 0;
 
   // Calculate dot product (only for shared keys)
+  let sharedKeys = 0;
   for (const [key, valA] of vecA) {
-    const valB = vecB.get(key) || 0;
-    dotProduct += valA * valB;
+    const valB = vecB.get(key);
+    if (valB !== undefined) {
+      dotProduct += valA * valB;
+      sharedKeys++;
+    }
     magA += valA * valA;
   }
 
@@ -105,22 +109,21 @@ function cosineSimilarity(vecA, vecB) {
 
   const cosine = dotProduct / (magA * magB);
 
-  // Calculate Jaccard similarity for word overlap
-  const keysA = new Set(vecA.keys());
-  const keysB = new Set(vecB.keys());
-  const intersection = [...keysA].filter(k => keysB.has(k)).length;
-  const union = new Set([...keysA, ...keysB]).size;
-  const jaccard = union > 0 ? intersection / union : 0;
+  // Jaccard similarity for word overlap, and the subset check below, both follow
+  // from the shared-key count — no need to materialize key Sets per comparison
+  const union = vecA.size + vecB.size - sharedKeys;
+  const jaccard = union > 0 ? sharedKeys / union : 0;
 
-  // Check for subset relationship (smaller is contained in larger)
-  const smaller = keysA.size <= keysB.size ? keysA : keysB;
-  const larger = keysA.size > keysB.size ? keysA : keysB;
-  const isSubset = [...smaller].every(k => larger.has(k));
+  // Subset relationship (smaller is contained in larger) ⇔ every key of the
+  // smaller vector is shared
+  const smallerSize = Math.min(vecA.size, vecB.size);
+  const largerSize = Math.max(vecA.size, vecB.size);
+  const isSubset = sharedKeys === smallerSize;
 
   // If one is a subset of the other, boost similarity significantly
   // This catches "sort array" being a duplicate of "sort array ascending"
-  if (isSubset && smaller.size >= 2) {
-    const subsetRatio = smaller.size / larger.size;
+  if (isSubset && smallerSize >= 2) {
+    const subsetRatio = smallerSize / largerSize;
     // If subset covers most of the larger set, it's likely a duplicate
     if (subsetRatio >= 0.5) {
       return Math.max(cosine * 0.6 + jaccard * 0.4, 0.85 + (subsetRatio - 0.5) * 0.1);
@@ -149,6 +152,28 @@ function objectToMap(obj) {
   return new Map(Object.entries(obj));
 }
 
+/**
+ * Stored embeddings are plain objects (so they serialize); the Map form is
+ * rebuilt once per embedding and reused across every later comparison.
+ * @type {WeakMap<Object, Map<string, number>>}
+ */
+const _embeddingMaps = new WeakMap();
+
+/**
+ * Get a stored pattern's embedding as a Map
+ * @param {Map|Object} embedding
+ * @returns {Map<string, number>}
+ */
+function embeddingAsMap(embedding) {
+  if (embedding instanceof Map) return embedding;
+  let map = _embeddingMaps.get(embedding);
+  if (!map) {
+    map = objectToMap(embedding);
+    _embeddingMaps.set(embedding, map);
+  }
+  return map;
+}
+
 /**
  * PatternRAGStore - Stores and retrieves successful code patterns
  */
@@ -191,13 +216,9 @@ class PatternRAGStore {
     const embedding = generateEmbedding(pattern.task);
 
     // Check for duplicates
-    const isDuplicate = this.patterns.some(existingPattern => {
-      const existingEmbedding = existingPattern.embedding instanceof Map
-        ? existingPattern.embedding
-        : objectToMap(existingPattern.embedding);
-      const similarity = cosineSimilarity(embedding, existingEmbedding);
-      return similarity >= this.similarityThreshold;
-    });
+    const isDuplicate = this.patterns.some(existingPattern =>
+      cosineSimilarity(embedding, embeddingAsMap(existingPattern.embedding)) >= this.similarityThreshold
+    );
 
     if (isDuplicate) {
       return null;
@@ -241,15 +262,10 @@ class PatternRAGStore {
   async findSimilar(task, limit = 3) {
     const taskEmbedding = generateEmbedding(task);
 
-    const similarities = this.patterns.map(pattern => {
-      const patternEmbedding = pattern.embedding instanceof Map
-        ? pattern.embedding
-        : objectToMap(pattern.embedding);
-      return {
-        pattern,
-        similarity: cosineSimilarity(taskEmbedding, patternEmbedding)
-      };
-    });
+    const similarities = this.patterns.map(pattern => ({
+      pattern,
+      similarity: cosineSimilarity(taskEmbedding, embeddingAsMap(pattern.embedding))
+    }));
 
     const sorted = similarities
       .filter(item => item.similarity > 0.1)
@@ -2,6 +2,10 @@
 // JSON compliance utility for MCP server responses
 // Removes emojis and ensures valid JSON structure for Claude Desktop compatibility
 
+// Compiled once at module load rather than per call
+const EMOJI_PATTERN = /⚠️|🎯|🏗️|⚙️|🚀|📊|✅|❌|🔍|🧠|⚡|【≽ܫ≼】/g;
+const WHITESPACE_RUN_PATTERN = /\s+/g;
+
 /**
  * Sanitizes text content to ensure JSON compliance
  * Removes all emoji characters that cause JSON parsing failures in Claude Desktop
@@ -18,13 +22,13 @@ function sanitizeForJSON(content) {
     content = String(content);
   }
 
+  // Collapsing every whitespace run to a single space also removes every newline,
+  // so no separate blank-line pass is needed afterwards
   return content
     // Remove emoji characters that break JSON parsing
-    .replace(/⚠️|🎯|🏗️|⚙️|🚀|📊|✅|❌|🔍|🧠|⚡|【≽ܫ≼】/g, '')
+    .replace(EMOJI_PATTERN, '')
     // Remove extra whitespace from emoji removal
-    .replace(/\s+/g, ' ')
-    // Clean up multiple newlines
-    .replace(/\n\s*\n/g, '\n')
+    .replace(WHITESPACE_RUN_PATTERN, ' ')
     // Trim leading/trailing whitespace
     .trim();
 }
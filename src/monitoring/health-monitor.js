@@ -9,6 +9,9 @@
  * - Smart routing analytics
  */
 
+// checkAll() samples retained for uptime and history queries
+const HEALTH_HISTORY_MAX_ENTRIES = 100;
+
 class HealthMonitor {
   constructor(options = {}) {
     this.backends = new Map();
@@ -25,9 +28,9 @@ class HealthMonitor {
     this.metrics = {
       totalChecks: 0,
       lastFullCheck: null,
-      avgLatency: 0,
-      healthHistory: []
+      avgLatency: 0
     };
+    this._resetHealthHistory();
 
     this.intervalId = null;
   }
@@ -64,7 +67,7 @@ class HealthMonitor {
     }
 
     backend.checkCount++;
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     try {
       const health = await backend.adapter.checkHealth();
@@ -93,7 +96,7 @@ class HealthMonitor {
       backend.lastHealth = {
         name,
         healthy: false,
-        latency: Date.now() - startTime,
+        latency: Math.round(performance.now() - startTime),
         circuitOpen: backend.adapter.circuitOpen || false,
         successRate: (backend.successCount / backend.checkCount) * 100,
         lastCheck: new Date(),
@@ -111,28 +114,23 @@ class HealthMonitor {
 
   async checkAll() {
     this.metrics.totalChecks++;
-    const startTime = Date.now();
+    const startTime = performance.now();
 
-    const healthChecks = [];
-    for (const [name] of this.backends) {
-      healthChecks.push(this.checkBackend(name));
+    // Sized up front from the registry; one pass then tallies both aggregates
+    const results = await Promise.all(
+      Array.from(this.backends.keys(), name => this.checkBackend(name))
+    );
+    let healthyCount = 0;
+    let totalLatency = 0;
+    for (const r of results) {
+      if (r.healthy) healthyCount++;
+      totalLatency += r.latency || 0;
     }
 
-    const results = await Promise.all(healthChecks);
-    const healthyCount = results.filter(r => r.healthy).length;
-    const totalLatency = results.reduce((sum, r) => sum + (r.latency || 0), 0);
-
     this.metrics.lastFullCheck = new Date();
     this.metrics.avgLatency = totalLatency / results.length;
 
-    this.metrics.healthHistory.push({
-      timestamp: new Date(),
-      healthyCount,
-      total: results.length
-    });
-    if (this.metrics.healthHistory.length > 100) {
-      this.metrics.healthHistory.shift();
-    }
+    this._recordHealthSample(Date.now(), healthyCount, results.length);
 
     return {
       overall: healthyCount > 0,
@@ -140,7 +138,7 @@ class HealthMonitor {
       totalBackends: results.length,
       backends: results,
       metrics: {
-        checkDuration: Date.now() - startTime,
+        checkDuration: Math.round(performance.now() - startTime),
         avgBackendLatency: this.metrics.avgLatency,
         totalChecksPerformed: this.metrics.totalChecks,
         uptimePercentage: this.calculateUptime()
@@ -149,22 +147,75 @@ class HealthMonitor {
     };
   }
 
+  /**
+   * Health history is a fixed-size ring stored column-wise in typed arrays:
+   * recording a sample is three indexed writes with no allocation or shift(),
+   * and a running count of healthy samples keeps calculateUptime() O(1).
+   * @private
+   */
+  _resetHealthHistory() {
+    this._historyTimestamps = new Float64Array(HEALTH_HISTORY_MAX_ENTRIES);
+    this._historyHealthy = new Uint32Array(HEALTH_HISTORY_MAX_ENTRIES);
+    this._historyTotal = new Uint32Array(HEALTH_HISTORY_MAX_ENTRIES);
+    this._historyHead = 0;
+    this._historyCount = 0;
+    this._historyUpSamples = 0;
+  }
+
+  /**
+   * @private
+   */
+  _recordHealthSample(timestamp, healthyCount, total) {
+    const i = this._historyHead;
+    if (this._historyCount === HEALTH_HISTORY_MAX_ENTRIES) {
+      if (this._historyHealthy[i] > 0) this._historyUpSamples--;
+    } else {
+      this._historyCount++;
+    }
+    this._historyTimestamps[i] = timestamp;
+    this._historyHealthy[i] = healthyCount;
+    this._historyTotal[i] = total;
+    if (healthyCount > 0) this._historyUpSamples++;
+    this._historyHead = (i + 1) % HEALTH_HISTORY_MAX_ENTRIES;
+  }
+
+  /**
+   * Recorded checkAll() samples, oldest first
+   * @param {number} [sinceMs=0] - Only include samples taken at or after this epoch time
+   * @returns {Array<{timestamp: Date, healthyCount: number, total: number}>}
+   */
+  getHealthHistory(sinceMs = 0) {
+    const history = [];
+    const start = this._historyHead - this._historyCount + HEALTH_HISTORY_MAX_ENTRIES;
+    for (let n = 0; n < this._historyCount; n++) {
+      const i = (start + n) % HEALTH_HISTORY_MAX_ENTRIES;
+      const timestamp = this._historyTimestamps[i];
+      if (timestamp < sinceMs) continue;
+      history.push({
+        timestamp: new Date(timestamp),
+        healthyCount: this._historyHealthy[i],
+        total: this._historyTotal[i]
+      });
+    }
+    return history;
+  }
+
   calculateUptime() {
-    if (this.metrics.healthHistory.length === 0) return 100;
-    const healthyChecks = this.metrics.healthHistory.filter(h => h.healthyCount > 0).length;
-    return (healthyChecks / this.metrics.healthHistory.length) * 100;
+    if (this._historyCount === 0) return 100;
+    return (this._historyUpSamples / this._historyCount) * 100;
   }
 
   getCurrentStatus() {
-    const backends = [];
+    const backends = new Array(this.backends.size);
     let healthyCount = 0;
+    let i = 0;
 
     for (const [name, backend] of this.backends) {
       if (backend.lastHealth) {
-        backends.push(backend.lastHealth);
+        backends[i++] = backend.lastHealth;
         if (backend.lastHealth.healthy) healthyCount++;
       } else {
-        backends.push({ name, healthy: false, error: 'Never checked' });
+        backends[i++] = { name, healthy: false, error: 'Never checked' };
       }
     }
 
@@ -214,6 +265,7 @@ class HealthMonitor {
   getMetrics() {
     return {
       ...this.metrics,
+      healthHistory: this.getHealthHistory(),
       registeredBackends: this.backends.size,
       monitoring: this.intervalId !== null
     };
@@ -223,9 +275,9 @@ class HealthMonitor {
     this.metrics = {
       totalChecks: 0,
       lastFullCheck: null,
-      avgLatency: 0,
-      healthHistory: []
+      avgLatency: 0
     };
+    this._resetHealthHistory();
 
     for (const [, backend] of this.backends) {
       backend.checkCount = 0;
@@ -3,37 +3,72 @@
  * @module monitoring/spawn-metrics
  */
 
+/**
+ * Per-role spawn counters. One fixed-shape record per role means each
+ * recording is a single Map lookup instead of one per counter map.
+ */
+class RoleCounters {
+  constructor() {
+    this.total = 0;
+    this.successful = 0;
+    this.failed = 0;
+  }
+}
+
 class SpawnMetrics {
   constructor() {
     this.totalSpawns = 0;
     this.successfulSpawns = 0;
     this.failedSpawns = 0;
-    this.spawnsByRole = new Map();
-    this.successByRole = new Map();
-    this.errorsByRole = new Map();
-    this.processingTimes = [];
+    this.roleCounters = new Map();
+    // Rolling window of the last maxProcessingTimes durations: a fixed ring with a
+    // running sum, so recording is O(1) (no Array.shift) and the average needs no rescan
+    this.maxProcessingTimes = 100;
+    this.processingTimes = new Float64Array(this.maxProcessingTimes);
+    this.processingCount = 0;
+    this.processingHead = 0;
+    this.processingSum = 0;
+    this.sortedProcessingTimes = null;
     this.recentErrors = [];
     this.maxRecentErrors = 10;
     this.startTime = new Date();
   }
 
+  /**
+   * @private
+   */
+  countersFor(role) {
+    let counters = this.roleCounters.get(role);
+    if (!counters) {
+      counters = new RoleCounters();
+      this.roleCounters.set(role, counters);
+    }
+    return counters;
+  }
+
   recordSpawnAttempt(role) {
     this.totalSpawns++;
-    this.spawnsByRole.set(role, (this.spawnsByRole.get(role) || 0) + 1);
+    this.countersFor(role).total++;
   }
 
   recordSpawnSuccess(role, processingTimeMs) {
     this.successfulSpawns++;
-    this.successByRole.set(role, (this.successByRole.get(role) || 0) + 1);
-    this.processingTimes.push(processingTimeMs);
-    if (this.processingTimes.length > 100) {
-      this.processingTimes.shift();
+    this.countersFor(role).successful++;
+    if (this.processingCount === this.maxProcessingTimes) {
+      // Window full: the slot about to be overwritten is the oldest sample
+      this.processingSum -= this.processingTimes[this.processingHead];
+    } else {
+      this.processingCount++;
     }
+    this.processingTimes[this.processingHead] = processingTimeMs;
+    this.processingHead = (this.processingHead + 1) % this.maxProcessingTimes;
+    this.processingSum += processingTimeMs;
+    this.sortedProcessingTimes = null;
   }
 
   recordSpawnError(role, errorMessage) {
     this.failedSpawns++;
-    this.errorsByRole.set(role, (this.errorsByRole.get(role) || 0) + 1);
+    this.countersFor(role).failed++;
     this.recentErrors.push({
       timestamp: new Date().toISOString(),
       role,
@@ -68,15 +103,15 @@ class SpawnMetrics {
   getRoleDistribution() {
     const distribution = {};
 
-    for (const [role, count] of this.spawnsByRole.entries()) {
-      const successCount = this.successByRole.get(role) || 0;
-      const errorCount = this.errorsByRole.get(role) || 0;
-      const roleSuccessRate = count > 0 ? (successCount / count) * 100 : 0;
+    for (const [role, { total: count, successful, failed }] of this.roleCounters) {
+      // Roles only appear once an attempt has been recorded for them
+      if (count === 0) continue;
+      const roleSuccessRate = (successful / count) * 100;
 
       distribution[role] = {
         total: count,
-        successful: successCount,
-        failed: errorCount,
+        successful,
+        failed,
         successRate: Math.round(roleSuccessRate * 100) / 100,
         percentage: Math.round((count / this.totalSpawns) * 100 * 100) / 100
       };
@@ -86,7 +121,7 @@ class SpawnMetrics {
   }
 
   getPerformanceStats() {
-    if (this.processingTimes.length === 0) {
+    if (this.processingCount === 0) {
       return {
         avgProcessingTimeMs: 0,
         minProcessingTimeMs: 0,
@@ -97,9 +132,13 @@ class SpawnMetrics {
       };
     }
 
-    const sorted = [...this.processingTimes].sort((a, b) => a - b);
-    const sum = sorted.reduce((acc, val) => acc + val, 0);
-    const avg = sum / sorted.length;
+    // Percentiles need an ordered copy; keep it until the next sample arrives so
+    // repeated summary/report calls don't re-sort an unchanged window
+    if (!this.sortedProcessingTimes) {
+      this.sortedProcessingTimes = this.processingTimes.slice(0, this.processingCount).sort();
+    }
+    const sorted = this.sortedProcessingTimes;
+    const avg = this.processingSum / this.processingCount;
 
     return {
       avgProcessingTimeMs: Math.round(avg),
@@ -140,23 +179,24 @@ class SpawnMetrics {
     this.totalSpawns = 0;
     this.successfulSpawns = 0;
     this.failedSpawns = 0;
-    this.spawnsByRole.clear();
-    this.successByRole.clear();
-    this.errorsByRole.clear();
-    this.processingTimes = [];
+    this.roleCounters.clear();
+    this.processingTimes.fill(0);
+    this.processingCount = 0;
+    this.processingHead = 0;
+    this.processingSum = 0;
+    this.sortedProcessingTimes = null;
     this.recentErrors = [];
     this.startTime = new Date();
   }
 
   getRoleMetrics(role) {
-    if (!this.spawnsByRole.has(role)) {
+    const counters = this.roleCounters.get(role);
+    if (!counters || counters.total === 0) {
       return null;
     }
 
-    const total = this.spawnsByRole.get(role);
-    const successful = this.successByRole.get(role) || 0;
-    const failed = this.errorsByRole.get(role) || 0;
-    const successRate = total > 0 ? (successful / total) * 100 : 0;
+    const { total, successful, failed } = counters;
+    const successRate = (successful / total) * 100;
 
     return {
       role,
@@ -93,15 +93,16 @@ class UsageAnalytics {
   }
 
   /**
-   * Export a combined report in JSON or markdown format
+   * Combined report as a plain object — for callers that embed it in a larger
+   * payload and would otherwise have to parse exportReport's JSON back out
    */
-  async exportReport(format = 'json', timeRange = '7d') {
+  async buildReport(timeRange = '7d') {
     const session = this.getSessionStats();
     const historical = await this.getHistoricalAnalytics(timeRange);
     const cost = await this.getCostAnalysis();
     const recommendations = await this.getOptimizationRecommendations();
 
-    const report = {
+    return {
       report_type: 'full',
       generated_at: new Date().toISOString(),
       time_range: timeRange,
@@ -110,6 +111,13 @@ class UsageAnalytics {
       cost,
       recommendations: recommendations.recommendations
     };
+  }
+
+  /**
+   * Export a combined report in JSON or markdown format
+   */
+  async exportReport(format = 'json', timeRange = '7d') {
+    const report = await this.buildReport(timeRange);
 
     if (format === 'markdown') {
       return this._toMarkdown(report);
@@ -11,6 +11,7 @@
 
 import { ConcurrentRequestManager } from './utils/concurrent-request-manager.js';
 import { detectLanguage as _detectLanguage } from './utils/language-detector.js';
+import { INFO_LOGGING } from './utils/log-level.js';
 
 export class MultiAIRouter {
   /**
@@ -40,31 +41,32 @@ export class MultiAIRouter {
    * @returns {Promise<string>} Backend name
    */
   async routeRequest(prompt, options = {}) {
-    this._lastRoutingContext = this.createRoutingContext(prompt, options);
+    // Extract once; tiers record their decision on this request's own routing record
+    const context = this._extractContext(prompt, options);
+    const routing = this._buildRoutingContext(context);
+    this._lastRoutingContext = routing;
 
     // Tier 1: Honor explicit backend selection
     const forcedBackend = options.forceBackend || options.backend;
     if (forcedBackend && forcedBackend !== 'auto') {
-      this._lastRoutingContext.source = 'forced';
-      this._lastRoutingContext.decision = forcedBackend;
-      this._lastRoutingContext.confidence = 1.0;
-      this._lastRoutingContext.reasoning = 'Explicit backend selection';
+      routing.source = 'forced';
+      routing.decision = forcedBackend;
+      routing.confidence = 1.0;
+      routing.reasoning = 'Explicit backend selection';
       return forcedBackend;
     }
 
-    const context = this._extractContext(prompt, options);
-
     // Tier 2: Learning engine recommendation (if available and confident)
     if (this.learningEngine) {
       const recommendation = this.learningEngine.getRecommendation(context);
       if (recommendation && recommendation.confidence > 0.7) {
-        console.error(`[Router] Learning recommendation: ${recommendation.backend} (confidence: ${recommendation.confidence.toFixed(2)})`);
+        if (INFO_LOGGING) console.error(`[Router] Learning recommendation: ${recommendation.backend} (confidence: ${recommendation.confidence.toFixed(2)})`);
         const backends = await this.registry.checkHealth();
         if (backends[recommendation.backend]?.healthy) {
-          this._lastRoutingContext.source = 'learning';
-          this._lastRoutingContext.decision = recommendation.backend;
-          this._lastRoutingContext.confidence = recommendation.confidence;
-          this._lastRoutingContext.reasoning = 'Learning engine recommendation';
+          routing.source = 'learning';
+          routing.decision = recommendation.backend;
+          routing.confidence = recommendation.confidence;
+          routing.reasoning = 'Learning engine recommendation';
           return recommendation.backend;
         }
       }
@@ -73,21 +75,21 @@ export class MultiAIRouter {
     // Tier 3: Rule-based routing
     const ruleBackend = await this._applyRuleBasedRouting(context);
     if (ruleBackend) {
-      console.error(`[Router] Rule-based routing: ${ruleBackend} (${context.complexity}/${context.taskType})`);
-      this._lastRoutingContext.source = 'rules';
-      this._lastRoutingContext.decision = ruleBackend;
-      this._lastRoutingContext.confidence = 0.75;
-      this._lastRoutingContext.reasoning = 'Rule-based routing';
+      if (INFO_LOGGING) console.error(`[Router] Rule-based routing: ${ruleBackend} (${context.complexity}/${context.taskType})`);
+      routing.source = 'rules';
+      routing.decision = ruleBackend;
+      routing.confidence = 0.75;
+      routing.reasoning = 'Rule-based routing';
       return ruleBackend;
     }
 
     // Tier 4: Health-based fallback
     const fallbackChain = this.registry.getFallbackChain();
     const selected = fallbackChain[0] || 'local';
-    this._lastRoutingContext.source = 'fallback';
-    this._lastRoutingContext.decision = selected;
-    this._lastRoutingContext.confidence = 0.4;
-    this._lastRoutingContext.reasoning = 'Fallback chain first healthy backend';
+    routing.source = 'fallback';
+    routing.decision = selected;
+    routing.confidence = 0.4;
+    routing.reasoning = 'Fallback chain first healthy backend';
     return selected;
   }
 
@@ -237,7 +239,14 @@ export class MultiAIRouter {
   }
 
   createRoutingContext(prompt, options = {}) {
-    const context = this._extractContext(prompt, options);
+    return this._buildRoutingContext(this._extractContext(prompt, options));
+  }
+
+  /**
+   * Wrap extracted prompt context in an undecided routing record
+   * @private
+   */
+  _buildRoutingContext(context) {
     return {
       ...context,
       source: 'unknown',
@@ -28,7 +28,6 @@ import { CORE_TOOL_DEFINITIONS } from './tools/tool-definitions.js';
 import Ajv from 'ajv';
 import { HandlerFactory } from './handlers/index.js';
 import { BackendRegistry } from './backends/backend-registry.js';
-import { sanitizeForJSON } from './json-sanitizer.js';
 import { PlaybookSystem } from './intelligence/playbook-system.js';
 import { MultiAIRouter } from './router.js';
 import CompoundLearningEngine from './intelligence/compound-learning.js';
@@ -40,6 +39,7 @@ import ConversationThreading from './threading/conversation-threading.js';
 import { UsageAnalytics } from './monitoring/usage-analytics.js';
 import { setBackendRegistry } from './config/council-config-manager.js';
 import { crushToolResult, DEFAULT_CRUSHER_CONFIG } from './compression/smartCrush.js';
+import { INFO_LOGGING } from './utils/log-level.js';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const pkg = JSON.parse(readFileSync(join(__dirname, '../package.json'), 'utf8'));
@@ -57,6 +57,9 @@ const compressionConfig = {
   ...(process.env.SAB_COMPRESSION_ENABLED === 'true' ? { enabled: true } :
       process.env.SAB_COMPRESSION_ENABLED === 'false' ? { enabled: false } : {})
 };
+// The dispatch path only uses the crushed value, never the token stats — skip the two
+// full-payload JSON.stringify passes crushToolResult would otherwise spend on them.
+const dispatchCompressionConfig = { ...compressionConfig, measureTokens: false };
 
 // ── Tool argument validators ─────────────────────────────────────
 const ajv = new Ajv({ allErrors: true, strict: false });
@@ -192,7 +195,8 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
   const { name, arguments: args } = request.params;
   const startTime = Date.now();
 
-  console.error(`[SAB] CallTool: ${name}`);
+  // Per-call trace lines are info level; MCP_LOG_LEVEL=warn/error/silent drops them
+  if (INFO_LOGGING) console.error(`[SAB] CallTool: ${name}`);
 
   const handlerName = toolToHandler.get(name);
   if (!handlerName) {
@@ -210,8 +214,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
   try {
     const result = await handlerFactory.execute(handlerName, args || {});
-    const elapsed = Date.now() - startTime;
-    console.error(`[SAB] ${name} completed in ${elapsed}ms`);
+    if (INFO_LOGGING) console.error(`[SAB] ${name} completed in ${Date.now() - startTime}ms`);
 
     // Normalize result format
     // If handler already returns MCP-formatted content array, pass through directly.
@@ -227,21 +230,23 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     // Apply SmartCrusher compression to the raw result before serialization.
     // On any compression error, fall back to the uncrushed result (no behavior change).
     let payload = result;
-    // crushToolResult() JSON.stringifies the whole payload for stats BEFORE checking
-    // cfg.enabled — skip the call entirely while compression is off (the default).
+    // Skip the call entirely while compression is off (the default).
     if (compressionConfig.enabled) {
       try {
-        payload = crushToolResult(result, compressionConfig).value;
+        payload = crushToolResult(result, dispatchCompressionConfig).value;
       } catch (compressionError) {
         console.error(`[SAB] ${name} compression skipped: ${compressionError.message}`);
         payload = result;
       }
     }
 
+    // Serialize exactly once. sanitizeForJSON returns objects untouched, so it is
+    // not run on this path; the format stays pretty-printed because
+    // buildSuccessResponseWithSavings measures tokens_saved against it.
     const content = typeof payload === 'string'
       ? payload
       : typeof payload === 'object' && payload !== null
-        ? JSON.stringify(sanitizeForJSON(payload), null, 2)
+        ? JSON.stringify(payload, null, 2)
         : String(payload);
 
     return {
@@ -290,7 +295,9 @@ if (process.env.SAB_DISABLE_READINESS_AUDIT !== 'true') {
       const { auditReadiness, formatFindings } = await import('./backends/readiness-audit.js');
       const councilConfig = JSON.parse(readFileSync(join(__dirname, '../config/council-config.json'), 'utf8'));
       const result = await auditReadiness({ backendsConfig: _backendsConfig, councilConfig });
-      for (const line of formatFindings(result)) console.error(line);
+      // One stderr write for the whole report instead of one per finding
+      const lines = formatFindings(result);
+      if (lines.length > 0) console.error(lines.join('\n'));
     } catch (err) {
       console.error(`[SAB] Readiness audit skipped: ${err.message}`);
     }
@@ -4,11 +4,21 @@ import crypto from 'crypto';
 // Logger shim - mcp-logger.js was archived; use console.error for MCP stderr compliance
 const logger = { info: (...args) => console.error('[ConversationThreading]', ...args) };
 
+// metadata.backends_used is a Set in memory and an array on disk
+const serializeSets = (key, value) => (value instanceof Set ? Array.from(value) : value);
+
+// Shared stand-in for threads persisted without backends_used; only ever iterated
+const NO_BACKENDS = Object.freeze([]);
+
 class ConversationThreading {
     constructor(dataDir = './data/conversations') {
         this.dataDir = dataDir;
         this.activeThreads = new Map();
         this.maxActiveThreads = 10;
+        // Per-thread tail of queued writes; threads never wait on each other
+        this.threadLocks = new Map();
+        // In-flight disk loads, so concurrent misses share one parsed thread object
+        this.pendingLoads = new Map();
     }
 
     async init() {
@@ -69,15 +79,40 @@ class ConversationThreading {
         };
     }
 
+    /**
+     * Run a read-modify-write task exclusively for one thread. Tasks for the
+     * same thread_id run in call order; tasks for different threads are not
+     * serialized against each other.
+     */
+    async withThreadLock(thread_id, task) {
+        const previous = this.threadLocks.get(thread_id) || Promise.resolve();
+        const run = previous.then(task);
+        const tail = run.catch(() => {});
+        this.threadLocks.set(thread_id, tail);
+
+        try {
+            return await run;
+        } finally {
+            if (this.threadLocks.get(thread_id) === tail) {
+                this.threadLocks.delete(thread_id);
+            }
+        }
+    }
+
     async addTurn(thread_id, turn_data) {
+        return this.withThreadLock(thread_id, () => this.appendTurn(thread_id, turn_data));
+    }
+
+    async appendTurn(thread_id, turn_data) {
         const thread = await this.loadThread(thread_id);
         const turn_number = thread.turns.length + 1;
         const continuation_id = `${thread_id}_turn${turn_number}`;
+        const now = new Date().toISOString();
 
         const turn = {
             continuation_id,
             turn_number,
-            timestamp: new Date().toISOString(),
+            timestamp: now,
             prompt: turn_data.prompt?.substring(0, 200) || '',
             backend_used: turn_data.backend_used || 'default',
             tokens_used: turn_data.tokens_used || 0,
@@ -85,7 +120,7 @@ class ConversationThreading {
         };
 
         thread.turns.push(turn);
-        thread.updated_at = new Date().toISOString();
+        thread.updated_at = now;
 
         // Update metadata
         thread.metadata.total_turns = turn_number;
@@ -159,6 +194,8 @@ class ConversationThreading {
     async searchConversations(query) {
         const files = await fs.readdir(this.dataDir);
         const results = [];
+        // Lower-case the query once, not once per thread and per turn
+        const needle = query.toLowerCase();
 
         for (const file of files) {
             if (!file.endsWith('.json')) continue;
@@ -168,9 +205,9 @@ class ConversationThreading {
                 const data = await fs.readFile(filePath, 'utf8');
                 const thread = JSON.parse(data);
 
-                const topicMatch = thread.topic?.toLowerCase().includes(query.toLowerCase());
+                const topicMatch = thread.topic?.toLowerCase().includes(needle);
                 const promptMatches = thread.turns.filter(turn =>
-                    turn.prompt?.toLowerCase().includes(query.toLowerCase())
+                    turn.prompt?.toLowerCase().includes(needle)
                 );
 
                 if (topicMatch || promptMatches.length > 0) {
@@ -228,7 +265,7 @@ class ConversationThreading {
                 analytics.topic_distribution[mainTopic] =
                     (analytics.topic_distribution[mainTopic] || 0) + 1;
 
-                const backends = thread.metadata.backends_used || [];
+                const backends = thread.metadata.backends_used || NO_BACKENDS;
                 for (const backend of backends) {
                     analytics.backend_usage[backend] =
                         (analytics.backend_usage[backend] || 0) + 1;
@@ -246,16 +283,9 @@ class ConversationThreading {
 
     async persistThread(thread) {
         try {
-            const threadToSave = {
-                ...thread,
-                metadata: {
-                    ...thread.metadata,
-                    backends_used: Array.from(thread.metadata.backends_used)
-                }
-            };
-
+            // Serialize the live thread directly rather than cloning it per write
             const filePath = path.join(this.dataDir, `${thread.thread_id}.json`);
-            await fs.writeFile(filePath, JSON.stringify(threadToSave, null, 2));
+            await fs.writeFile(filePath, JSON.stringify(thread, serializeSets, 2));
         } catch (error) {
             console.error(`Failed to persist thread ${thread.thread_id}:`, error);
             throw error;
@@ -267,6 +297,17 @@ class ConversationThreading {
             return this.activeThreads.get(thread_id);
         }
 
+        let pending = this.pendingLoads.get(thread_id);
+        if (!pending) {
+            pending = this.readThread(thread_id).finally(() => {
+                this.pendingLoads.delete(thread_id);
+            });
+            this.pendingLoads.set(thread_id, pending);
+        }
+        return pending;
+    }
+
+    async readThread(thread_id) {
         try {
             const filePath = path.join(this.dataDir, `${thread_id}.json`);
             const data = await fs.readFile(filePath, 'utf8');
@@ -6,6 +6,8 @@
  * Infers model capabilities from model IDs and scores backend matches.
  */
 
+import { DEBUG_LOGGING } from './log-level.js';
+
 /**
  * Capability taxonomy for AI backends
  * @enum {string}
@@ -121,27 +123,44 @@ const BACKEND_CAPABILITIES = {
  */
 const ORCHESTRATOR_PORTS = [8085, 8083];
 
+/**
+ * Capabilities inferred per model ID. The same handful of IDs is looked up on
+ * every routing decision, and the answer depends only on the ID, so the pattern
+ * scan runs once per ID. Bounded with FIFO eviction like the other module caches.
+ * @type {Map<string, string[]>}
+ */
+const INFERRED_CAPABILITIES_MAX_ENTRIES = 256;
+const _inferredCapabilities = new Map();
+
 /**
  * Infer capabilities from a model ID string
  * @param {string} modelId - Model identifier (e.g., "Seed-Coder-8B-Instruct")
- * @returns {string[]} Array of capability strings
+ * @returns {string[]} Array of capability strings (shared — do not mutate)
  */
 function inferCapabilitiesFromModelId(modelId) {
   if (!modelId) {
     return [CAPABILITIES.GENERAL];
   }
 
-  const normalizedId = modelId.toLowerCase();
+  const cached = _inferredCapabilities.get(modelId);
+  if (cached) {
+    return cached;
+  }
 
-  // Check each pattern in order (more specific first)
+  // Check each pattern in order (more specific first); default to general
+  let inferred = [CAPABILITIES.GENERAL];
   for (const { pattern, capabilities } of MODEL_CAPABILITY_PATTERNS) {
-    if (pattern.test(normalizedId)) {
-      return capabilities;
+    if (pattern.test(modelId)) {
+      inferred = capabilities;
+      break;
     }
   }
 
-  // Default to general capabilities
-  return [CAPABILITIES.GENERAL];
+  if (_inferredCapabilities.size >= INFERRED_CAPABILITIES_MAX_ENTRIES) {
+    _inferredCapabilities.delete(_inferredCapabilities.keys().next().value);
+  }
+  _inferredCapabilities.set(modelId, inferred);
+  return inferred;
 }
 
 /**
@@ -237,6 +256,23 @@ function scoreCapabilityMatch(backendCaps, requiredCaps) {
   return Math.min(matchPercentage + bonusScore, 100);
 }
 
+/** Task phrasings that signal a large scope (compiled once, not per call) */
+const LARGE_SCOPE_INDICATORS = [
+  /entire\s+(codebase|project|repository)/i,
+  /all\s+(files|components|modules)/i,
+  /comprehensive|complete|full\s+analysis/i,
+  /refactor.*entire/i,
+  /architecture.*review/i
+];
+
+/** Task phrasings that signal a small scope */
+const SMALL_SCOPE_INDICATORS = [
+  /single\s+(file|function|method)/i,
+  /quick\s+(review|fix|check)/i,
+  /this\s+(function|method|class)/i,
+  /just\s+(add|fix|update)/i
+];
+
 /**
  * Estimate task context size from task description and file patterns
  * @param {string} task - Task description
@@ -261,29 +297,14 @@ function estimateTaskContextSize(task, filePatterns = []) {
   else if (fileCount > 0) contextScore += 1;
 
   // Check for indicators of large scope in task
-  const largeIndicators = [
-    /entire\s+(codebase|project|repository)/i,
-    /all\s+(files|components|modules)/i,
-    /comprehensive|complete|full\s+analysis/i,
-    /refactor.*entire/i,
-    /architecture.*review/i
-  ];
-
-  for (const indicator of largeIndicators) {
+  for (const indicator of LARGE_SCOPE_INDICATORS) {
     if (indicator.test(task)) {
       contextScore += 2;
     }
   }
 
   // Check for indicators of small scope
-  const smallIndicators = [
-    /single\s+(file|function|method)/i,
-    /quick\s+(review|fix|check)/i,
-    /this\s+(function|method|class)/i,
-    /just\s+(add|fix|update)/i
-  ];
-
-  for (const indicator of smallIndicators) {
+  for (const indicator of SMALL_SCOPE_INDICATORS) {
     if (indicator.test(task)) {
       contextScore -= 2;
     }
@@ -341,9 +362,9 @@ function findBestBackend(options) {
     getLocalCapabilities = () => [CAPABILITIES.GENERAL]
   } = options;
 
-  console.error('[DEBUG] findBestBackend - requiredCapabilities:', requiredCapabilities);
-  console.error('[DEBUG] findBestBackend - availableBackends:', availableBackends);
-  console.error('[DEBUG] findBestBackend - contextSize:', contextSize);
+  if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - requiredCapabilities:', requiredCapabilities);
+  if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - availableBackends:', availableBackends);
+  if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - contextSize:', contextSize);
 
   // Check routing rules first for context-sensitive selection
   if (routingRules) {
@@ -352,7 +373,7 @@ function findBestBackend(options) {
       : routingRules.small_task;
 
     if (rule && availableBackends.includes(rule.prefer)) {
-      console.error('[DEBUG] findBestBackend - routing rule matched:', rule.prefer);
+      if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - routing rule matched:', rule.prefer);
       return {
         backend: rule.prefer,
         score: 100,
@@ -369,11 +390,11 @@ function findBestBackend(options) {
       ? getLocalCapabilities()
       : getBackendCapabilities(backend);
 
-    console.error(`[DEBUG] findBestBackend - ${backend} caps:`, caps);
+    if (DEBUG_LOGGING) console.error(`[DEBUG] findBestBackend - ${backend} caps:`, caps);
 
     const score = scoreCapabilityMatch(caps, requiredCapabilities);
 
-    console.error(`[DEBUG] findBestBackend - ${backend} score:`, score);
+    if (DEBUG_LOGGING) console.error(`[DEBUG] findBestBackend - ${backend} score:`, score);
 
     if (score > 0) {
       scored.push({
@@ -385,21 +406,21 @@ function findBestBackend(options) {
     }
   }
 
-  console.error('[DEBUG] findBestBackend - all scored:', scored);
+  if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - all scored:', scored);
 
   // Sort by score descending
   scored.sort((a, b) => b.score - a.score);
 
   // Return best match if any
   if (scored.length > 0 && scored[0].score > 0) {
-    console.error('[DEBUG] findBestBackend - best match:', scored[0]);
+    if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - best match:', scored[0]);
     return scored[0];
   }
 
   // Use fallback order
   for (const fb of fallbackOrder) {
     if (availableBackends.includes(fb)) {
-      console.error('[DEBUG] findBestBackend - fallback:', fb);
+      if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - fallback:', fb);
       return {
         backend: fb,
         score: 25,
@@ -410,7 +431,7 @@ function findBestBackend(options) {
 
   // Ultimate fallback to local
   if (availableBackends.includes('local')) {
-    console.error('[DEBUG] findBestBackend - ultimate fallback to local');
+    if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - ultimate fallback to local');
     return {
       backend: 'local',
       score: 10,
@@ -419,7 +440,7 @@ function findBestBackend(options) {
   }
 
   // No suitable backend found
-  console.error('[DEBUG] findBestBackend - no backend found');
+  if (DEBUG_LOGGING) console.error('[DEBUG] findBestBackend - no backend found');
   return {
     backend: null,
     score: 0,
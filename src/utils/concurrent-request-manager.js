@@ -26,6 +26,11 @@
  * @property {string} id - Unique request identifier
  */
 
+// Throughput is averaged over the busy seconds among the last 10; one extra
+// bucket holds the current second alongside them
+const THROUGHPUT_WINDOW_SECONDS = 10;
+const THROUGHPUT_BUCKETS = THROUGHPUT_WINDOW_SECONDS + 1;
+
 class ConcurrentRequestManager {
   /**
    * Create a new ConcurrentRequestManager
@@ -47,8 +52,9 @@ class ConcurrentRequestManager {
       throughputPerSecond: 0
     };
 
-    this.lastThroughputUpdate = Date.now();
-    this.throughputWindow = new Map();
+    // Per-second completion counts in a fixed ring, indexed by second % buckets
+    this.throughputSeconds = new Float64Array(THROUGHPUT_BUCKETS);
+    this.throughputCounts = new Uint32Array(THROUGHPUT_BUCKETS);
   }
 
   /**
@@ -59,13 +65,14 @@ class ConcurrentRequestManager {
    */
   async executeRequest(requestPromise, priority = 'normal') {
     return new Promise((resolve, reject) => {
+      const now = Date.now();
       /** @type {Request} */
       const request = {
         promise: requestPromise,
         resolve,
         reject,
-        startTime: Date.now(),
-        queueTime: Date.now(),
+        startTime: now,
+        queueTime: now,
         priority,
         id: Math.random().toString(36).substr(2, 9)
       };
@@ -133,10 +140,13 @@ class ConcurrentRequestManager {
   processNextInQueue() {
     if (this.activeRequests.size >= this.maxConcurrent) return;
 
-    // Process priority queue first for maximum responsiveness
+    // Process priority queue first for maximum responsiveness. Hand the freed slot
+    // over synchronously: processRequest claims it before its first await, so there
+    // is no gap for a newly submitted request to take the slot ahead of the queue
+    // and push concurrency past maxConcurrent.
     const nextRequest = this.priorityQueue.shift() || this.requestQueue.shift();
     if (nextRequest) {
-      setImmediate(() => this.processRequest(nextRequest));
+      this.processRequest(nextRequest);
     }
   }
 
@@ -145,22 +155,27 @@ class ConcurrentRequestManager {
    * @private
    */
   updateThroughput() {
-    const now = Date.now();
-    const windowKey = Math.floor(now / 1000);
-
-    this.throughputWindow.set(windowKey, (this.throughputWindow.get(windowKey) || 0) + 1);
+    const second = Math.floor(Date.now() / 1000);
+    const slot = second % THROUGHPUT_BUCKETS;
 
-    // Clean old entries (keep last 10 seconds)
-    for (const [key] of this.throughputWindow) {
-      if (key < windowKey - 10) {
-        this.throughputWindow.delete(key);
+    // A slot still holding an older second is stale; reclaim it
+    if (this.throughputSeconds[slot] !== second) {
+      this.throughputSeconds[slot] = second;
+      this.throughputCounts[slot] = 0;
+    }
+    this.throughputCounts[slot]++;
+
+    // Average over busy seconds still inside the window
+    const oldest = second - THROUGHPUT_WINDOW_SECONDS;
+    let totalRequests = 0;
+    let busySeconds = 0;
+    for (let i = 0; i < THROUGHPUT_BUCKETS; i++) {
+      if (this.throughputCounts[i] > 0 && this.throughputSeconds[i] >= oldest) {
+        totalRequests += this.throughputCounts[i];
+        busySeconds++;
       }
     }
-
-    // Calculate current throughput
-    const totalRequests = Array.from(this.throughputWindow.values())
-      .reduce((sum, count) => sum + count, 0);
-    this.metrics.throughputPerSecond = totalRequests / Math.min(this.throughputWindow.size, 10);
+    this.metrics.throughputPerSecond = totalRequests / Math.min(busySeconds, THROUGHPUT_WINDOW_SECONDS);
   }
 
   /**
@@ -187,7 +202,8 @@ class ConcurrentRequestManager {
       queueWaitTime: 0,
       throughputPerSecond: 0
     };
-    this.throughputWindow.clear();
+    this.throughputSeconds.fill(0);
+    this.throughputCounts.fill(0);
   }
 
   /**
@@ -0,0 +1,45 @@
+/**
+ * @fileoverview Levenshtein edit distance
+ * @module utils/levenshtein
+ *
+ * Two-row dynamic programme over typed arrays: O(n*m) time like the textbook
+ * matrix, but O(min(n, m)) memory and no per-row array allocations.
+ */
+
+/**
+ * Calculate Levenshtein distance between two strings
+ * @param {string} str1 - First string
+ * @param {string} str2 - Second string
+ * @returns {number}
+ */
+function levenshteinDistance(str1, str2) {
+  // Keep the shorter string along the row so the buffers stay small
+  const [longer, shorter] = str1.length >= str2.length ? [str1, str2] : [str2, str1];
+  const cols = shorter.length;
+  if (cols === 0) return longer.length;
+
+  let prev = new Uint32Array(cols + 1);
+  let curr = new Uint32Array(cols + 1);
+  for (let j = 0; j <= cols; j++) prev[j] = j;
+
+  for (let i = 1; i <= longer.length; i++) {
+    curr[0] = i;
+    const ch = longer.charCodeAt(i - 1);
+    for (let j = 1; j <= cols; j++) {
+      if (ch === shorter.charCodeAt(j - 1)) {
+        curr[j] = prev[j - 1];
+      } else {
+        curr[j] = Math.min(
+          prev[j - 1] + 1, // substitution
+          curr[j - 1] + 1, // insertion
+          prev[j] + 1      // deletion
+        );
+      }
+    }
+    [prev, curr] = [curr, prev];
+  }
+
+  return prev[cols];
+}
+
+export { levenshteinDistance };
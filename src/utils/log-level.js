@@ -0,0 +1,15 @@
+/**
+ * @fileoverview Log level gates
+ * @module utils/log-level
+ *
+ * Resolved once at load from MCP_LOG_LEVEL, so hot paths can skip building
+ * log messages with a single boolean check.
+ */
+
+const LOG_LEVEL = (process.env.MCP_LOG_LEVEL || 'info').toLowerCase();
+
+const DEBUG_LOGGING = LOG_LEVEL === 'debug';
+// Anything short of a quieter level keeps the default info output
+const INFO_LOGGING = !['silent', 'error', 'warn'].includes(LOG_LEVEL);
+
+export { DEBUG_LOGGING, INFO_LOGGING };
@@ -0,0 +1,130 @@
+/**
+ * @fileoverview ResponseCache - Exact-match cache for deterministic backend calls
+ * @module utils/response-cache
+ *
+ * Cloud completions cost tokens and take seconds; an identical low-temperature
+ * request is effectively deterministic, so replaying the previous answer is safe.
+ *
+ * - Key: sha256 of the endpoint URL + the serialized request body (model,
+ *   messages, temperature, top_p, max_tokens... whatever the adapter sent)
+ * - Only non-streaming requests with temperature <= maxTemperature are cached
+ * - LRU eviction (Map insertion order) with a per-entry TTL
+ * - Hits report zero token usage and metadata.cached = true
+ *
+ * Off by default; enable with SAB_RESPONSE_CACHE=true.
+ */
+
+import { createHash } from 'node:crypto';
+
+const DEFAULT_MAX_ENTRIES = 1024;
+const DEFAULT_TTL_MS = 60 * 60 * 1000;
+const DEFAULT_MAX_TEMPERATURE = 0.2;
+
+class ResponseCache {
+  /**
+   * @param {Object} [options]
+   * @param {number} [options.maxEntries=1024] - LRU capacity
+   * @param {number} [options.ttlMs=3600000] - Entry lifetime
+   * @param {number} [options.maxTemperature=0.2] - Highest temperature treated as deterministic
+   * @param {boolean} [options.enabled=true] - Enable caching
+   */
+  constructor(options = {}) {
+    this.maxEntries = options.maxEntries || DEFAULT_MAX_ENTRIES;
+    this.ttlMs = options.ttlMs || DEFAULT_TTL_MS;
+    this.maxTemperature = options.maxTemperature ?? DEFAULT_MAX_TEMPERATURE;
+    this.enabled = options.enabled !== false;
+
+    /** @type {Map<string, {value: Object, expiresAt: number}>} */
+    this.entries = new Map();
+
+    this.stats = { hits: 0, misses: 0, evictions: 0 };
+  }
+
+  /**
+   * Whether a request body is deterministic enough to cache
+   * @param {Object} body - Request body about to be sent
+   * @returns {boolean}
+   */
+  isCacheable(body) {
+    return this.enabled &&
+      !body?.stream &&
+      typeof body?.temperature === 'number' &&
+      body.temperature <= this.maxTemperature;
+  }
+
+  /**
+   * Build the cache key for a request
+   * @param {string} url - Endpoint URL (distinguishes providers serving the same model id)
+   * @param {string} serializedBody - The exact JSON body sent on the wire
+   * @returns {string}
+   */
+  keyFor(url, serializedBody) {
+    return createHash('sha256').update(`${url}\n${serializedBody}`).digest('hex');
+  }
+
+  /**
+   * Look up a cached response; refreshes its LRU position on hit
+   * @param {string} key
+   * @returns {Object|undefined} A copy of the cached response
+   */
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      this.stats.misses++;
+      return undefined;
+    }
+    if (Date.now() > entry.expiresAt) {
+      this.entries.delete(key);
+      this.stats.misses++;
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.stats.hits++;
+    return structuredClone(entry.value);
+  }
+
+  /**
+   * Store a response, evicting the least recently used entry when full
+   * @param {string} key
+   * @param {Object} value - Parsed response body
+   */
+  set(key, value) {
+    if (this.entries.has(key)) {
+      this.entries.delete(key);
+    } else if (this.entries.size >= this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+      this.stats.evictions++;
+    }
+    this.entries.set(key, { value: structuredClone(value), expiresAt: Date.now() + this.ttlMs });
+  }
+
+  /**
+   * Drop every entry
+   */
+  clear() {
+    this.entries.clear();
+  }
+
+  /**
+   * Cache statistics
+   * @returns {Object}
+   */
+  getStats() {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.entries.size,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0
+    };
+  }
+}
+
+/** Process-wide cache shared by every backend adapter (opt-in) */
+const responseCache = new ResponseCache({
+  enabled: process.env.SAB_RESPONSE_CACHE === 'true'
+});
+
+export { ResponseCache, responseCache };
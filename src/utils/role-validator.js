@@ -4,6 +4,7 @@
  */
 
 import { getAvailableRoles, getRoleTemplate } from '../config/role-templates.js';
+import { levenshteinDistance } from './levenshtein.js';
 
 /**
  * @typedef {Object} ValidationResult
@@ -12,6 +13,14 @@ import { getAvailableRoles, getRoleTemplate } from '../config/role-templates.js'
  * @property {Object} [template] - Role template if valid
  */
 
+/**
+ * Role name -> template, built once: the template table is static, so per-call
+ * validation is a single Map lookup instead of rebuilding and scanning the key list.
+ * @type {Map<string, Object>}
+ */
+const ROLE_LOOKUP = new Map(getAvailableRoles().map(name => [name, getRoleTemplate(name)]));
+const AVAILABLE_ROLES_LIST = [...ROLE_LOOKUP.keys()].join(', ');
+
 /**
  * Validate subagent role
  * @param {string} role - Role to validate
@@ -30,16 +39,15 @@ function validateRole(role) {
   const normalizedRole = role.trim().toLowerCase();
 
   // Check role exists
-  const availableRoles = getAvailableRoles();
-  if (!availableRoles.includes(normalizedRole)) {
+  if (!ROLE_LOOKUP.has(normalizedRole)) {
     return {
       valid: false,
-      error: `Unknown role: "${role}". Available roles: ${availableRoles.join(', ')}`
+      error: `Unknown role: "${role}". Available roles: ${AVAILABLE_ROLES_LIST}`
     };
   }
 
   // Get role template
-  const template = getRoleTemplate(normalizedRole);
+  const template = ROLE_LOOKUP.get(normalizedRole);
   if (!template) {
     return {
       valid: false,
@@ -117,41 +125,6 @@ function suggestSimilarRoles(role) {
   return distances.slice(0, 3).map(d => d.role);
 }
 
-/**
- * Calculate Levenshtein distance between two strings
- * @private
- * @param {string} str1 - First string
- * @param {string} str2 - Second string
- * @returns {number}
- */
-function levenshteinDistance(str1, str2) {
-  const matrix = [];
-
-  for (let i = 0; i <= str2.length; i++) {
-    matrix[i] = [i];
-  }
-
-  for (let j = 0; j <= str1.length; j++) {
-    matrix[0][j] = j;
-  }
-
-  for (let i = 1; i <= str2.length; i++) {
-    for (let j = 1; j <= str1.length; j++) {
-      if (str2.charAt(i - 1) === str1.charAt(j - 1)) {
-        matrix[i][j] = matrix[i - 1][j - 1];
-      } else {
-        matrix[i][j] = Math.min(
-          matrix[i - 1][j - 1] + 1, // substitution
-          matrix[i][j - 1] + 1,     // insertion
-          matrix[i - 1][j] + 1      // deletion
-        );
-      }
-    }
-  }
-
-  return matrix[str2.length][str1.length];
-}
-
 export {
   validateRole,
   validateRoles,
@@ -5,6 +5,20 @@
 
 import yaml from 'yaml';
 
+// Field aliases accepted for each verdict property, checked in order
+const STATUS_FIELDS = ['status', 'Status', 'verdict', 'Verdict', 'decision', 'Decision'];
+const SCORE_FIELDS = ['score', 'Score', 'quality_score', 'Quality Score', 'rating', 'Rating'];
+const REASONING_FIELDS = ['reasoning', 'Reasoning', 'explanation', 'Explanation', 'rationale', 'Rationale'];
+const RISK_FIELDS = ['risk_level', 'Risk Level', 'riskLevel', 'severity', 'Severity'];
+
+// Plain-text "Key: value" fallbacks (non-global, so safe to share across calls)
+const KEY_VALUE_PATTERNS = [
+  { key: 'status', regex: /(?:Status|Verdict):\s*([A-Z_]+)/i },
+  { key: 'score', regex: /(?:Score|Quality|Rating):\s*(\d+(?:\.\d+)?)\s*(?:\/\s*10)?/i },
+  { key: 'reasoning', regex: /Reasoning:\s*(.+?)(?:\n|$)/i },
+  { key: 'riskLevel', regex: /Risk\s+Level:\s*([A-Z]+)/i }
+];
+
 /**
  * @typedef {Object} Verdict
  * @property {string} status - Verdict status (APPROVE|APPROVE_WITH_CHANGES|REJECT|etc)
@@ -123,15 +137,7 @@ function extractMarkdownVerdict(response) {
 function extractKeyValueVerdict(response) {
   const verdict = {};
 
-  // Common verdict patterns
-  const patterns = [
-    { key: 'status', regex: /(?:Status|Verdict):\s*([A-Z_]+)/i },
-    { key: 'score', regex: /(?:Score|Quality|Rating):\s*(\d+(?:\.\d+)?)\s*(?:\/\s*10)?/i },
-    { key: 'reasoning', regex: /Reasoning:\s*(.+?)(?:\n|$)/i },
-    { key: 'riskLevel', regex: /Risk\s+Level:\s*([A-Z]+)/i }
-  ];
-
-  for (const { key, regex } of patterns) {
+  for (const { key, regex } of KEY_VALUE_PATTERNS) {
     const match = response.match(regex);
     if (match) {
       verdict[key] = parseValue(match[1].trim());
@@ -152,20 +158,18 @@ function extractKeyValueVerdict(response) {
  * @returns {Verdict}
  */
 function normalizeVerdict(raw) {
-  const normalized = {
-    status: extractStatus(raw),
-    score: extractScore(raw),
-    reasoning: extractReasoning(raw),
-    riskLevel: extractRiskLevel(raw),
-    raw
-  };
-
-  // Remove undefined fields
-  Object.keys(normalized).forEach(key => {
-    if (normalized[key] === undefined) {
-      delete normalized[key];
-    }
-  });
+  // Only assign fields that resolved, rather than building all and deleting
+  const normalized = {};
+
+  const status = extractStatus(raw);
+  if (status !== undefined) normalized.status = status;
+  const score = extractScore(raw);
+  if (score !== undefined) normalized.score = score;
+  const reasoning = extractReasoning(raw);
+  if (reasoning !== undefined) normalized.reasoning = reasoning;
+  const riskLevel = extractRiskLevel(raw);
+  if (riskLevel !== undefined) normalized.riskLevel = riskLevel;
+  if (raw !== undefined) normalized.raw = raw;
 
   return normalized;
 }
@@ -175,8 +179,7 @@ function normalizeVerdict(raw) {
  * @private
  */
 function extractStatus(raw) {
-  const statusFields = ['status', 'Status', 'verdict', 'Verdict', 'decision', 'Decision'];
-  for (const field of statusFields) {
+  for (const field of STATUS_FIELDS) {
     if (raw[field]) {
       return String(raw[field]).toUpperCase();
     }
@@ -189,8 +192,7 @@ function extractStatus(raw) {
  * @private
  */
 function extractScore(raw) {
-  const scoreFields = ['score', 'Score', 'quality_score', 'Quality Score', 'rating', 'Rating'];
-  for (const field of scoreFields) {
+  for (const field of SCORE_FIELDS) {
     if (raw[field] !== undefined) {
       const score = parseFloat(raw[field]);
       return isNaN(score) ? undefined : Math.min(10, Math.max(0, score));
@@ -204,8 +206,7 @@ function extractScore(raw) {
  * @private
  */
 function extractReasoning(raw) {
-  const reasoningFields = ['reasoning', 'Reasoning', 'explanation', 'Explanation', 'rationale', 'Rationale'];
-  for (const field of reasoningFields) {
+  for (const field of REASONING_FIELDS) {
     if (raw[field]) {
       return String(raw[field]);
     }
@@ -218,8 +219,7 @@ function extractReasoning(raw) {
  * @private
  */
 function extractRiskLevel(raw) {
-  const riskFields = ['risk_level', 'Risk Level', 'riskLevel', 'severity', 'Severity'];
-  for (const field of riskFields) {
+  for (const field of RISK_FIELDS) {
     if (raw[field]) {
       return String(raw[field]).toUpperCase();
     }
@@ -0,0 +1,74 @@
+import { describe, it, expect } from 'vitest';
+import { BackendAdapter, CIRCUIT_CLOSED, CIRCUIT_OPEN, CIRCUIT_HALF_OPEN } from '../src/backends/backend-adapter.js';
+
+class StubAdapter extends BackendAdapter {
+  constructor() {
+    super({ name: 'stub' });
+    this.pending = [];
+  }
+
+  makeRequest() {
+    return new Promise((resolve, reject) => this.pending.push({ resolve, reject }));
+  }
+
+  async checkHealth() {
+    return { healthy: true };
+  }
+}
+
+function expiredCircuit() {
+  const adapter = new StubAdapter();
+  adapter.openCircuit();
+  adapter.circuitOpenedAt = Date.now() - adapter.circuitResetTimeout - 1;
+  return adapter;
+}
+
+describe('BackendAdapter circuit breaker state', () => {
+  it('lets exactly one request probe once the reset timeout expires', async () => {
+    const adapter = expiredCircuit();
+
+    const probe = adapter.execute('first');
+    expect(adapter.circuitState).toBe(CIRCUIT_HALF_OPEN);
+    await expect(adapter.execute('second')).rejects.toThrow('Circuit breaker open for stub');
+    expect(adapter.pending).toHaveLength(1);
+
+    adapter.pending[0].resolve({ content: 'ok' });
+    await expect(probe).resolves.toMatchObject({ success: true });
+    expect(adapter.circuitState).toBe(CIRCUIT_CLOSED);
+    expect(adapter.circuitOpen).toBe(false);
+  });
+
+  it('re-opens the circuit when the probe fails', async () => {
+    const adapter = expiredCircuit();
+
+    const probe = adapter.execute('first');
+    adapter.pending[0].reject(new Error('still down'));
+    await expect(probe).rejects.toThrow('still down');
+    expect(adapter.circuitState).toBe(CIRCUIT_OPEN);
+    expect(Date.now() - adapter.circuitOpenedAt).toBeLessThan(adapter.circuitResetTimeout);
+  });
+
+  it('does not let a stale probe close a circuit forced open meanwhile', async () => {
+    const adapter = expiredCircuit();
+
+    const probe = adapter.execute('first');
+    adapter.openCircuit();
+    adapter.pending[0].resolve({ content: 'ok' });
+    await probe;
+    expect(adapter.circuitState).toBe(CIRCUIT_OPEN);
+  });
+
+  it('uses the health check as the probe in isAvailable()', async () => {
+    const adapter = expiredCircuit();
+    await expect(adapter.isAvailable()).resolves.toBe(true);
+    expect(adapter.circuitState).toBe(CIRCUIT_CLOSED);
+  });
+
+  it('keeps the circuitOpen flag writable for subclasses', () => {
+    const adapter = new StubAdapter();
+    adapter.circuitOpen = true;
+    expect(adapter.circuitState).toBe(CIRCUIT_OPEN);
+    adapter.closeCircuit();
+    expect(adapter.circuitOpen).toBe(false);
+  });
+});
@@ -0,0 +1,47 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { getRetryDelay } from '../src/backends/backend-adapter.js';
+import { TestAdapter, okResponse, errorResponse } from './helpers/adapter-fixtures.js';
+
+describe('getRetryDelay', () => {
+  it('backs off exponentially without a Retry-After header', () => {
+    const response = errorResponse(503);
+    expect(getRetryDelay(response, 0)).toBe(300);
+    expect(getRetryDelay(response, 1)).toBe(600);
+    expect(getRetryDelay(response, 10)).toBe(8000);
+  });
+
+  it('honors Retry-After and gives up when it exceeds the cap', () => {
+    expect(getRetryDelay(errorResponse(429, { 'retry-after': '2' }), 0)).toBe(2000);
+    expect(getRetryDelay(errorResponse(429, { 'retry-after': '60' }), 0)).toBeNull();
+  });
+});
+
+describe('BackendAdapter.makeAPICall retries', () => {
+  const originalFetch = global.fetch;
+  afterEach(() => { global.fetch = originalFetch; });
+
+  const adapter = () => new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+  it('retries transient 5xx responses until one succeeds', async () => {
+    global.fetch = vi.fn()
+      .mockResolvedValueOnce(errorResponse(503, { 'retry-after': '0' }))
+      .mockResolvedValueOnce(errorResponse(502, { 'retry-after': '0' }))
+      .mockResolvedValueOnce(okResponse('recovered'));
+
+    const result = await adapter().makeRequest('hi');
+    expect(result.content).toBe('recovered');
+    expect(global.fetch).toHaveBeenCalledTimes(3);
+  });
+
+  it('stops after maxRetries and surfaces the last error', async () => {
+    global.fetch = vi.fn().mockResolvedValue(errorResponse(503, { 'retry-after': '0' }));
+    await expect(adapter().makeRequest('hi')).rejects.toThrow('API error: 503');
+    expect(global.fetch).toHaveBeenCalledTimes(3);
+  });
+
+  it('does not retry client errors', async () => {
+    global.fetch = vi.fn().mockResolvedValue(errorResponse(400));
+    await expect(adapter().makeRequest('hi')).rejects.toThrow('API error: 400');
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+});
@@ -67,6 +67,13 @@ describe('BaseHandler utilities', () => {
       expect(result).toContain('[Output compacted');
       expect(result.split('\n').length).toBeLessThan(lines.length);
     });
+    it('handles outputs with more distinct lines than the call-stack limit', () => {
+      const lines = [];
+      for (let i = 0; i < 200000; i++) lines.push('distinct ' + i);
+      for (let i = 0; i < 6; i++) lines.push('repeated line');
+      const result = handler.collapseRepetitiveOutput(lines.join('\n'));
+      expect(result).toContain('[Output compacted');
+    });
     it('does not collapse if max repeat < 6', () => {
       const lines = [];
       for (let i = 0; i < 25; i++) lines.push('line ' + (i % 10));
@@ -101,4 +108,21 @@ describe('BaseHandler utilities', () => {
       expect(handler.estimateTokens('abcdefgh')).toBe(2);
     });
   });
+
+  describe('levenshteinDistance', () => {
+    it('handles empty strings', () => {
+      expect(handler.levenshteinDistance('', '')).toBe(0);
+      expect(handler.levenshteinDistance('abc', '')).toBe(3);
+      expect(handler.levenshteinDistance('', 'abcd')).toBe(4);
+    });
+    it('counts substitutions, insertions and deletions', () => {
+      expect(handler.levenshteinDistance('kitten', 'sitting')).toBe(3);
+      expect(handler.levenshteinDistance('sitting', 'kitten')).toBe(3);
+      expect(handler.levenshteinDistance('flaw', 'lawn')).toBe(2);
+    });
+    it('feeds calculateStringSimilarity', () => {
+      expect(handler.calculateStringSimilarity('same', 'same')).toBe(1);
+      expect(handler.calculateStringSimilarity('abcd', 'abcf')).toBe(0.75);
+    });
+  });
 });
@@ -43,6 +43,14 @@ describe('Complexity Scorer', () => {
     expect(isComplex({ prompt: 'refactor optimize security authentication concurrent async streaming migration architecture database encryption oauth websocket', fileSize: 50000, fileCount: 15, toolType: 'generate' })).toBe(true);
   });
 
+  it('saturates keywordDensity at 1.0', () => {
+    const { factors } = scoreComplexity({
+      prompt: 'refactor optimize security authentication concurrent async streaming migration'
+    });
+    expect(factors.keywordDensity).toBe(1.0);
+    expect(scoreComplexity({ prompt: 'refactor async' }).factors.keywordDensity).toBe(0.4);
+  });
+
   it('handles empty prompt', () => {
     const { score } = scoreComplexity({ prompt: '' });
     expect(score).toBeGreaterThanOrEqual(0);
@@ -0,0 +1,79 @@
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { CompoundLearningEngine } from '../src/intelligence/compound-learning.js';
+
+function record(engine, backend, success) {
+  engine.recordOutcome({
+    backend,
+    context: { complexity: 'medium', taskType: 'coding' },
+    success,
+    latency: 100
+  });
+}
+
+// Trend as derived from the retained routing history, excluding the outcome just recorded
+function trendFromHistory(engine, backend) {
+  const samples = engine.routingHistory
+    .slice(0, -1)
+    .filter(h => h.backend === backend)
+    .slice(-20)
+    .map(h => h.success);
+  if (samples.length < 10) return 'stable';
+  const avg = list => list.reduce((sum, v) => sum + v, 0) / list.length;
+  const diff = avg(samples.slice(-5)) - avg(samples.slice(0, 5));
+  if (diff > 0.15) return 'improving';
+  if (diff < -0.15) return 'degrading';
+  return 'stable';
+}
+
+describe('CompoundLearningEngine trend detection', () => {
+  let dataDir;
+
+  beforeEach(() => {
+    dataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'sab-learning-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(dataDir, { recursive: true, force: true });
+  });
+
+  it('stays stable until a backend has enough outcomes', () => {
+    const engine = new CompoundLearningEngine({ dataDir });
+    for (let i = 0; i < 9; i++) record(engine, 'local', i < 5);
+    expect(engine.backendMetrics.local.trend).toBe('stable');
+  });
+
+  it('detects a degrading backend from its own recent outcomes', () => {
+    const engine = new CompoundLearningEngine({ dataDir });
+    for (let i = 0; i < 10; i++) record(engine, 'local', true);
+    for (let i = 0; i < 6; i++) {
+      record(engine, 'local', false);
+      record(engine, 'cloud', true); // interleaved traffic must not dilute the window
+    }
+    expect(engine.backendMetrics.local.trend).toBe('degrading');
+    expect(engine.backendMetrics.cloud.trend).toBe('stable');
+  });
+
+  it('forgets trend samples on reset', () => {
+    const engine = new CompoundLearningEngine({ dataDir });
+    for (let i = 0; i < 12; i++) record(engine, 'local', true);
+    engine.reset();
+    record(engine, 'local', false);
+    expect(engine.backendMetrics.local.trend).toBe('stable');
+  });
+
+  it('drops trend samples whose history entries were trimmed', () => {
+    const engine = new CompoundLearningEngine({ dataDir });
+    for (let i = 0; i < 15; i++) record(engine, 'rare', i < 10);
+    expect(engine.backendMetrics.rare.trend).toBe('degrading');
+
+    for (let i = 0; i < 1000; i++) record(engine, 'busy', i % 3 !== 0);
+    record(engine, 'rare', true);
+
+    expect(engine.backendMetrics.rare.trend).toBe(trendFromHistory(engine, 'rare'));
+    expect(engine.backendMetrics.rare.trend).toBe('stable');
+    expect(engine.backendMetrics.busy.trend).toBe(trendFromHistory(engine, 'busy'));
+  });
+});
@@ -64,6 +64,18 @@ describe('crushToolResult — compression', () => {
     expect(stats.compressedTokens).toBeLessThan(stats.originalTokens);
   });
 
+  it('skips token measurement when measureTokens is off, crushing identically', () => {
+    const measured = crushToolResult({ matches: repetitiveRows(100) }, { enabled: true });
+    const { value: out, stats } = crushToolResult(
+      { matches: repetitiveRows(100) },
+      { enabled: true, measureTokens: false }
+    );
+    expect(out).toEqual(measured.value);
+    expect(stats.originalTokens).toBe(0);
+    expect(stats.compressedTokens).toBe(0);
+    expect(stats.arraysCrushed).toBe(1);
+  });
+
   it('preserves important (error/fatal) rows', () => {
     const { value: out } = crushToolResult({ matches: repetitiveRows(100) }, { enabled: true });
     const kept = stripCcrSentinels(out.matches);
@@ -113,6 +125,20 @@ describe('reversibility (CCR)', () => {
   });
 });
 
+describe('sparse arrays', () => {
+  it('crushes an array of records with holes and restores it by hash', () => {
+    const rows = repetitiveRows(100);
+    delete rows[5];
+    delete rows[50];
+    const { value: out, stats } = crushToolResult({ matches: rows }, { enabled: true });
+    expect(stats.arraysCrushed).toBe(1);
+
+    const sentinel = sentinelOf(out.matches);
+    const hash = String(sentinel[CCR_SENTINEL_KEY]).match(/<<ccr:([a-f0-9]{12})/)[1];
+    expect(JSON.stringify(retrieveOriginal(hash))).toBe(JSON.stringify(rows));
+  });
+});
+
 describe('sentinel helpers', () => {
   it('isCcrSentinel only matches the sentinel object', () => {
     expect(isCcrSentinel({ [CCR_SENTINEL_KEY]: '<<ccr:abc 1_of_5_rows_offloaded>>' })).toBe(true);
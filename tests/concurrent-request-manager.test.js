@@ -0,0 +1,57 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { ConcurrentRequestManager } from '../src/utils/concurrent-request-manager.js';
+
+describe('ConcurrentRequestManager throughput window', () => {
+  afterEach(() => vi.useRealTimers());
+
+  it('averages completions over the busy seconds in the last 10', () => {
+    vi.useFakeTimers({ now: 1_000_000 });
+    const manager = new ConcurrentRequestManager();
+
+    for (let i = 0; i < 6; i++) manager.updateThroughput();
+    expect(manager.metrics.throughputPerSecond).toBe(6);
+
+    vi.advanceTimersByTime(3000);
+    for (let i = 0; i < 2; i++) manager.updateThroughput();
+    expect(manager.metrics.throughputPerSecond).toBe(4);
+  });
+
+  it('drops seconds that fall out of the window', () => {
+    vi.useFakeTimers({ now: 1_000_000 });
+    const manager = new ConcurrentRequestManager();
+
+    for (let i = 0; i < 10; i++) manager.updateThroughput();
+    vi.advanceTimersByTime(11_000);
+    manager.updateThroughput();
+    expect(manager.metrics.throughputPerSecond).toBe(1);
+  });
+
+  it('starts over after resetMetrics', () => {
+    vi.useFakeTimers({ now: 1_000_000 });
+    const manager = new ConcurrentRequestManager();
+
+    for (let i = 0; i < 5; i++) manager.updateThroughput();
+    manager.resetMetrics();
+    manager.updateThroughput();
+    expect(manager.metrics.throughputPerSecond).toBe(1);
+  });
+});
+
+describe('ConcurrentRequestManager queue hand-off', () => {
+  it('passes a freed slot to the queue before new submissions can take it', async () => {
+    const manager = new ConcurrentRequestManager(1);
+    const settleSoon = () => new Promise(resolve => setTimeout(resolve, 5));
+
+    const first = manager.executeRequest(Promise.resolve('first'));
+    const queued = manager.executeRequest(settleSoon());
+    expect(manager.getMetrics().queuedRequests).toBe(1);
+
+    await first;
+    expect(manager.getMetrics().activeConcurrency).toBe(1);
+    const late = manager.executeRequest(settleSoon());
+    await Promise.all([queued, late]);
+
+    expect(manager.metrics.peakConcurrency).toBe(1);
+    expect(manager.metrics.completedRequests).toBe(3);
+  });
+});
@@ -0,0 +1,73 @@
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import ConversationThreading from '../src/threading/conversation-threading.js';
+
+describe('ConversationThreading concurrent turns', () => {
+  let dataDir;
+
+  beforeEach(async () => {
+    dataDir = await fs.mkdtemp(path.join(os.tmpdir(), 'sab-threads-'));
+  });
+
+  afterEach(async () => {
+    await fs.rm(dataDir, { recursive: true, force: true });
+  });
+
+  it('keeps every turn when addTurn calls overlap on one thread', async () => {
+    const threading = new ConversationThreading(dataDir);
+    await threading.init();
+    const { thread_id } = await threading.createNewThread('topic', 'user', 'test');
+
+    const results = await Promise.all(
+      Array.from({ length: 20 }, (_, i) => threading.addTurn(thread_id, { prompt: `p${i}` }))
+    );
+
+    expect(results.map(r => r.turn_number)).toEqual(Array.from({ length: 20 }, (_, i) => i + 1));
+    const saved = JSON.parse(await fs.readFile(path.join(dataDir, `${thread_id}.json`), 'utf8'));
+    expect(saved.turns).toHaveLength(20);
+    expect(threading.threadLocks.size).toBe(0);
+  });
+
+  it('persists backends_used as an array without altering the live Set', async () => {
+    const threading = new ConversationThreading(dataDir);
+    await threading.init();
+    const { thread_id } = await threading.createNewThread('topic', 'user', 'test');
+    await threading.addTurn(thread_id, { prompt: 'p', backend_used: 'local' });
+
+    const saved = JSON.parse(await fs.readFile(path.join(dataDir, `${thread_id}.json`), 'utf8'));
+    expect(saved.metadata.backends_used).toEqual(['local']);
+    expect(threading.activeThreads.get(thread_id).metadata.backends_used).toBeInstanceOf(Set);
+  });
+
+  it('shares one load when a thread is fetched concurrently from disk', async () => {
+    const writer = new ConversationThreading(dataDir);
+    await writer.init();
+    const { thread_id } = await writer.createNewThread('topic', 'user', 'test');
+
+    const reader = new ConversationThreading(dataDir);
+    const [a, b] = await Promise.all([reader.loadThread(thread_id), reader.loadThread(thread_id)]);
+    expect(a).toBe(b);
+  });
+
+  it('releases the lock after a failed turn', async () => {
+    const threading = new ConversationThreading(dataDir);
+    await threading.init();
+    await expect(threading.addTurn('thread_missing', { prompt: 'x' })).rejects.toThrow('not found');
+    expect(threading.threadLocks.size).toBe(0);
+  });
+
+  it('matches search queries case-insensitively against topics and prompts', async () => {
+    const threading = new ConversationThreading(dataDir);
+    await threading.init();
+    const { thread_id } = await threading.createNewThread('Refactor Router', 'user', 'test');
+    await threading.addTurn(thread_id, { prompt: 'Split the ROUTER module' });
+    await threading.createNewThread('unrelated', 'user', 'test');
+
+    const results = await threading.searchConversations('rOuTeR');
+    expect(results).toHaveLength(1);
+    expect(results[0].matches.topic).toBe(true);
+    expect(results[0].matches.prompts).toEqual([{ turn_number: 1, prompt: 'Split the ROUTER module' }]);
+  });
+});
@@ -0,0 +1,30 @@
+import { describe, it, expect } from 'vitest';
+import { HandlerFactory, createHandler, hasHandler, HealthHandler } from '../src/handlers/index.js';
+
+describe('handler registry lookups', () => {
+  it('does not resolve Object.prototype member names as handlers', () => {
+    expect(hasHandler('toString')).toBe(false);
+    expect(hasHandler('constructor')).toBe(false);
+    expect(createHandler('constructor', {})).toBeNull();
+  });
+
+  it('resolves registered handler names', () => {
+    expect(hasHandler('handleCheckBackendHealth')).toBe(true);
+    expect(createHandler('handleCheckBackendHealth', {})).toBeInstanceOf(HealthHandler);
+  });
+});
+
+describe('HandlerFactory.getHandler', () => {
+  it('reuses one instance per handler name', () => {
+    const factory = new HandlerFactory({});
+    const first = factory.getHandler('handleCheckBackendHealth');
+    expect(first).toBeInstanceOf(HealthHandler);
+    expect(factory.getHandler('handleCheckBackendHealth')).toBe(first);
+  });
+
+  it('returns null for unknown names without caching them', () => {
+    const factory = new HandlerFactory({});
+    expect(factory.getHandler('handleNope')).toBeNull();
+    expect(factory.instances.has('handleNope')).toBe(false);
+  });
+});
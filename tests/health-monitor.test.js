@@ -0,0 +1,44 @@
+import { describe, it, expect } from 'vitest';
+import { HealthMonitor } from '../src/monitoring/health-monitor.js';
+
+function monitorWith(results) {
+  const monitor = new HealthMonitor();
+  monitor.cacheTTL = 0; // every checkAll() hits the adapter
+  let call = 0;
+  monitor.registerBackend('local', {
+    type: 'local',
+    checkHealth: async () => ({ healthy: results[call++ % results.length], latency: 1 })
+  });
+  return monitor;
+}
+
+describe('HealthMonitor health history', () => {
+  it('keeps the last 100 samples oldest first and tracks uptime over them', async () => {
+    // 150 checks: first 50 healthy, then alternating unhealthy/healthy
+    const pattern = [...Array(50).fill(true), ...Array.from({ length: 100 }, (_, i) => i % 2 === 1)];
+    const monitor = monitorWith(pattern);
+    for (let i = 0; i < pattern.length; i++) await monitor.checkAll();
+
+    const history = monitor.getMetrics().healthHistory;
+    expect(history).toHaveLength(100);
+    expect(history[0].healthyCount).toBe(0);
+    expect(history[0].timestamp).toBeInstanceOf(Date);
+    expect(monitor.calculateUptime()).toBe(50);
+  });
+
+  it('filters history by start time', async () => {
+    const monitor = monitorWith([true]);
+    await monitor.checkAll();
+    expect(monitor.getHealthHistory(0)).toHaveLength(1);
+    expect(monitor.getHealthHistory(Date.now() + 60000)).toHaveLength(0);
+  });
+
+  it('clears history on resetMetrics', async () => {
+    const monitor = monitorWith([false]);
+    await monitor.checkAll();
+    expect(monitor.calculateUptime()).toBe(0);
+    monitor.resetMetrics();
+    expect(monitor.calculateUptime()).toBe(100);
+    expect(monitor.getMetrics().healthHistory).toEqual([]);
+  });
+});
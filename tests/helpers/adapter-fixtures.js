@@ -0,0 +1,28 @@
+import { BackendAdapter } from '../../src/backends/backend-adapter.js';
+
+/**
+ * Minimal adapter that drives the real makeAPICall/parseResponse path
+ */
+export class TestAdapter extends BackendAdapter {
+  async makeRequest(prompt, options = {}) {
+    const data = await this.makeAPICall(this.buildRequestBody(prompt, options));
+    return this.parseResponse(data);
+  }
+}
+
+export function okResponse(content, usage) {
+  return {
+    ok: true,
+    status: 200,
+    json: async () => ({ choices: [{ message: { content } }], ...(usage && { usage }) })
+  };
+}
+
+export function errorResponse(status, headers = {}) {
+  return {
+    ok: false,
+    status,
+    headers: new Headers(headers),
+    text: async () => `status ${status}`
+  };
+}
@@ -0,0 +1,26 @@
+import { describe, it, expect } from 'vitest';
+import { sanitizeForJSON, createMCPResponse } from '../src/json-sanitizer.js';
+
+describe('sanitizeForJSON', () => {
+  it('strips emoji and collapses whitespace, including newlines', () => {
+    expect(sanitizeForJSON('✅ done\n\n  next 🚀\tstep ')).toBe('done next step');
+  });
+
+  it('is stable across repeated calls (shared regexes keep no state)', () => {
+    expect(sanitizeForJSON('⚠️ a ⚠️')).toBe('a');
+    expect(sanitizeForJSON('⚠️ a ⚠️')).toBe('a');
+  });
+
+  it('returns objects untouched and stringifies other primitives', () => {
+    const obj = { text: '✅' };
+    expect(sanitizeForJSON(obj)).toBe(obj);
+    expect(sanitizeForJSON(42)).toBe('42');
+  });
+
+  it('builds MCP error responses from sanitized text', () => {
+    expect(createMCPResponse('❌ boom', true)).toEqual({
+      content: [{ type: 'text', text: 'Error: boom' }],
+      isError: true
+    });
+  });
+});
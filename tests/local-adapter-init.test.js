@@ -0,0 +1,36 @@
+/**
+ * @fileoverview LocalAdapter endpoint discovery is shared by concurrent callers
+ * instead of being polled for.
+ */
+import { describe, it, expect, vi } from 'vitest';
+import { LocalAdapter } from '../src/backends/local-adapter.js';
+
+describe('LocalAdapter initialization', () => {
+  it('runs discovery once for concurrent ensureInitialized callers', async () => {
+    const adapter = new LocalAdapter({ skipAutodiscovery: true });
+    adapter.detector.discover = vi.fn(async () => null);
+
+    await Promise.all([
+      adapter.ensureInitialized(),
+      adapter.ensureInitialized(),
+      adapter.initializeEndpoint()
+    ]);
+
+    expect(adapter.detector.discover).toHaveBeenCalledTimes(1);
+    expect(adapter.initialized).toBe(true);
+    expect(adapter.initializing).toBe(false);
+    expect(adapter.config.url).toBe('http://127.0.0.1:8001/v1/chat/completions');
+  });
+
+  it('discovers again after forceRediscovery', async () => {
+    const adapter = new LocalAdapter({ skipAutodiscovery: true });
+    adapter.detector.discover = vi.fn(async () => null);
+    adapter.detector.clearCache = vi.fn();
+
+    await adapter.ensureInitialized();
+    await adapter.forceRediscovery();
+
+    expect(adapter.detector.discover).toHaveBeenCalledTimes(2);
+    expect(adapter.initialized).toBe(true);
+  });
+});
@@ -124,6 +124,24 @@ describe('auditReadiness', () => {
     expect(fetchMock).toHaveBeenCalledTimes(1);
   });
 
+  it('probes independent backends concurrently and keeps findings in config order', async () => {
+    const pending = [];
+    fetchMock.mockImplementation(() => new Promise((resolve, reject) => pending.push(reject)));
+    const cfg = backendsConfig({
+      local_a: { enabled: true, type: 'local', config: { url: LOCAL_URL, model: 'dynamic' } },
+      local_b: { enabled: true, type: 'local', config: { url: 'http://127.0.0.1:8082/v1/chat/completions', model: 'dynamic' } }
+    });
+    const audit = auditReadiness({ backendsConfig: cfg, councilConfig: {} });
+    await Promise.resolve();
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+
+    pending[1](new Error('b down'));
+    pending[0](new Error('a down'));
+    const { findings, checked } = await audit;
+    expect(checked).toBe(2);
+    expect(findings.map(f => f.backend)).toEqual(['local_a', 'local_b']);
+  });
+
   it('flags a council topic member that is not a defined backend', async () => {
     const cfg = backendsConfig({
       local: { enabled: true, type: 'local', config: { url: LOCAL_URL, model: 'dynamic' } }
@@ -0,0 +1,145 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { ResponseCache, responseCache } from '../src/utils/response-cache.js';
+import { TestAdapter, okResponse } from './helpers/adapter-fixtures.js';
+
+describe('ResponseCache', () => {
+  it('only caches non-streaming low-temperature bodies', () => {
+    const cache = new ResponseCache();
+    expect(cache.isCacheable({ temperature: 0 })).toBe(true);
+    expect(cache.isCacheable({ temperature: 0.2 })).toBe(true);
+    expect(cache.isCacheable({ temperature: 0.7 })).toBe(false);
+    expect(cache.isCacheable({ temperature: 0, stream: true })).toBe(false);
+    expect(cache.isCacheable({})).toBe(false);
+    expect(new ResponseCache({ enabled: false }).isCacheable({ temperature: 0 })).toBe(false);
+  });
+
+  it('keys on both endpoint and body', () => {
+    const cache = new ResponseCache();
+    const body = JSON.stringify({ model: 'm', temperature: 0 });
+    expect(cache.keyFor('https://a', body)).toBe(cache.keyFor('https://a', body));
+    expect(cache.keyFor('https://a', body)).not.toBe(cache.keyFor('https://b', body));
+  });
+
+  it('evicts the least recently used entry at capacity', () => {
+    const cache = new ResponseCache({ maxEntries: 2 });
+    cache.set('a', { v: 1 });
+    cache.set('b', { v: 2 });
+    cache.get('a');
+    cache.set('c', { v: 3 });
+    expect(cache.get('a')).toEqual({ v: 1 });
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.getStats().evictions).toBe(1);
+  });
+
+  it('expires entries after the TTL', () => {
+    vi.useFakeTimers();
+    try {
+      const cache = new ResponseCache({ ttlMs: 1000 });
+      cache.set('a', { v: 1 });
+      vi.advanceTimersByTime(1001);
+      expect(cache.get('a')).toBeUndefined();
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it('returns copies so callers cannot corrupt the cached value', () => {
+    const cache = new ResponseCache();
+    cache.set('a', { nested: { v: 1 } });
+    cache.get('a').nested.v = 99;
+    expect(cache.get('a')).toEqual({ nested: { v: 1 } });
+  });
+});
+
+describe('BackendAdapter.makeAPICall caching', () => {
+  const originalFetch = global.fetch;
+  const originalEnabled = responseCache.enabled;
+
+  beforeEach(() => {
+    responseCache.clear();
+    responseCache.enabled = true;
+  });
+  afterEach(() => {
+    global.fetch = originalFetch;
+    responseCache.enabled = originalEnabled;
+  });
+
+  it('is opt-in through SAB_RESPONSE_CACHE=true', () => {
+    expect(originalEnabled).toBe(process.env.SAB_RESPONSE_CACHE === 'true');
+  });
+
+  it('replays identical deterministic requests without a second fetch', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer'));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    const first = await adapter.makeRequest('hi', { temperature: 0.1 });
+    const second = await adapter.makeRequest('hi', { temperature: 0.1 });
+
+    expect(first.content).toBe('answer');
+    expect(second.content).toBe('answer');
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('reports replayed responses as cached and free of token usage', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer', { prompt_tokens: 5, completion_tokens: 7, total_tokens: 12 }));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    const first = await adapter.makeRequest('hi', { temperature: 0.1 });
+    const second = await adapter.makeRequest('hi', { temperature: 0.1 });
+
+    expect(first.tokens).toBe(12);
+    expect(first.metadata.cached).toBe(false);
+    expect(second.tokens).toBe(0);
+    expect(second.metadata.cached).toBe(true);
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('caches explicit temperature-0 requests instead of defaulting them to 0.7', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer'));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    expect(adapter.buildRequestBody('hi', { temperature: 0 }).temperature).toBe(0);
+    await adapter.makeRequest('hi', { temperature: 0 });
+    await adapter.makeRequest('hi', { temperature: 0 });
+
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('keeps cache hits out of latency, failure and circuit bookkeeping', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer'));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    await adapter.execute('hi', { temperature: 0 });
+    adapter.consecutiveFailures = 2;
+    const replay = await adapter.execute('hi', { temperature: 0 });
+
+    expect(replay.metadata.cached).toBe(true);
+    expect(adapter.metrics.successfulRequests).toBe(1);
+    expect(adapter.metrics.cachedResponses).toBe(1);
+    expect(adapter.consecutiveFailures).toBe(2);
+  });
+
+  it('sends a half-open probe to the backend instead of replaying it', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer'));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    await adapter.execute('hi', { temperature: 0 });
+    adapter.openCircuit();
+    adapter.circuitOpenedAt = Date.now() - adapter.circuitResetTimeout - 1;
+    const probe = await adapter.execute('hi', { temperature: 0 });
+
+    expect(probe.metadata.cached).toBe(false);
+    expect(global.fetch).toHaveBeenCalledTimes(2);
+    expect(adapter.circuitOpen).toBe(false);
+  });
+
+  it('always hits the network for sampled requests', async () => {
+    global.fetch = vi.fn().mockResolvedValue(okResponse('answer'));
+    const adapter = new TestAdapter({ name: 'test', url: 'https://example.test/v1/chat/completions' });
+
+    await adapter.makeRequest('hi');
+    await adapter.makeRequest('hi');
+
+    expect(global.fetch).toHaveBeenCalledTimes(2);
+  });
+});
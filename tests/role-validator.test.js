@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest';
+import { validateRole } from '../src/utils/role-validator.js';
+import { roleTemplates } from '../src/config/role-templates.js';
+
+describe('validateRole', () => {
+  it('normalizes the name and returns the shared template', () => {
+    const result = validateRole('  Code-Reviewer ');
+    expect(result.valid).toBe(true);
+    expect(result.template).toBe(roleTemplates['code-reviewer']);
+  });
+
+  it('rejects unknown and Object.prototype names with the role list', () => {
+    for (const role of ['nope', 'constructor', '__proto__']) {
+      const result = validateRole(role);
+      expect(result.valid).toBe(false);
+      expect(result.error).toContain('Available roles: ');
+    }
+  });
+
+  it('rejects missing or non-string roles', () => {
+    expect(validateRole(undefined).valid).toBe(false);
+    expect(validateRole(42).error).toBe('Role is required and must be a string');
+  });
+});
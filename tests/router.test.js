@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+import { MultiAIRouter } from '../src/router.js';
+
+function registryWith(health, fallbackChain = []) {
+  return {
+    checkHealth: async () => health,
+    getFallbackChain: () => fallbackChain
+  };
+}
+
+describe('MultiAIRouter.routeRequest', () => {
+  it('records the rule-based decision with the extracted context', async () => {
+    const router = new MultiAIRouter(registryWith({ nvidia_deepseek: { healthy: true } }));
+    const backend = await router.routeRequest('implement a function');
+
+    expect(backend).toBe('nvidia_deepseek');
+    expect(router._lastRoutingContext).toMatchObject({
+      taskType: 'code',
+      complexity: 'simple',
+      source: 'rules',
+      decision: 'nvidia_deepseek',
+      confidence: 0.75
+    });
+  });
+
+  it('keeps overlapping requests from writing into each other\'s routing record', async () => {
+    const router = new MultiAIRouter(registryWith({}, ['local']));
+    const pending = router.routeRequest('hello there');
+    const first = router._lastRoutingContext;
+    await router.routeRequest('force this', { backend: 'groq' });
+    await pending;
+
+    expect(first.decision).toBe('local');
+    expect(router._lastRoutingContext).toMatchObject({ source: 'forced', decision: 'groq' });
+  });
+});
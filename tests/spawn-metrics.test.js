@@ -0,0 +1,60 @@
+import { describe, it, expect } from 'vitest';
+import { SpawnMetrics } from '../src/monitoring/spawn-metrics.js';
+
+describe('SpawnMetrics rolling processing-time window', () => {
+  it('keeps only the last 100 samples', () => {
+    const metrics = new SpawnMetrics();
+    for (let i = 1; i <= 250; i++) metrics.recordSpawnSuccess('coder', i);
+
+    const stats = metrics.getPerformanceStats();
+    expect(stats.minProcessingTimeMs).toBe(151);
+    expect(stats.maxProcessingTimeMs).toBe(250);
+    expect(stats.avgProcessingTimeMs).toBe(Math.round((151 + 250) / 2));
+    expect(stats.p50ProcessingTimeMs).toBe(200);
+    expect(stats.p95ProcessingTimeMs).toBe(245);
+  });
+
+  it('refreshes percentiles after new samples arrive', () => {
+    const metrics = new SpawnMetrics();
+    metrics.recordSpawnSuccess('coder', 10);
+    expect(metrics.getPerformanceStats().maxProcessingTimeMs).toBe(10);
+    metrics.recordSpawnSuccess('coder', 500);
+    expect(metrics.getPerformanceStats().maxProcessingTimeMs).toBe(500);
+  });
+
+  it('starts from an empty window after reset', () => {
+    const metrics = new SpawnMetrics();
+    metrics.recordSpawnSuccess('coder', 42);
+    metrics.reset();
+    expect(metrics.getPerformanceStats().avgProcessingTimeMs).toBe(0);
+    metrics.recordSpawnSuccess('coder', 7);
+    expect(metrics.getPerformanceStats().avgProcessingTimeMs).toBe(7);
+  });
+});
+
+describe('SpawnMetrics per-role counters', () => {
+  it('reports attempts, successes and failures per role', () => {
+    const metrics = new SpawnMetrics();
+    for (let i = 0; i < 4; i++) metrics.recordSpawnAttempt('coder');
+    metrics.recordSpawnSuccess('coder', 10);
+    metrics.recordSpawnSuccess('coder', 20);
+    metrics.recordSpawnSuccess('coder', 30);
+    metrics.recordSpawnError('coder', 'boom');
+
+    expect(metrics.getRoleDistribution().coder).toEqual({
+      total: 4,
+      successful: 3,
+      failed: 1,
+      successRate: 75,
+      percentage: 100
+    });
+    expect(metrics.getRoleMetrics('coder').successRate).toBe(75);
+  });
+
+  it('ignores roles that never recorded an attempt', () => {
+    const metrics = new SpawnMetrics();
+    metrics.recordSpawnSuccess('reviewer', 5);
+    expect(metrics.getRoleDistribution()).toEqual({});
+    expect(metrics.getRoleMetrics('reviewer')).toBeNull();
+  });
+});